@@ -4,35 +4,46 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import os
+import pickle
 import re
+import string
+import threading
+import time
 import urllib.parse
 import urllib.request
-from collections import defaultdict
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterable, Literal, TypeVar
 
+import orjson
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 
-ALIAS_MAP: dict[str, list[str]] = {
-    "nyc": ["new york", "new york city"],
-    "new york city": ["new york", "nyc"],
-    "new york": ["nyc"],
-    "dc": ["washington dc", "washington"],
-    "washington dc": ["dc", "washington"],
-    "la": ["los angeles"],
-    "sf": ["san francisco"],
-    "uk": ["united kingdom"],
-    "uae": ["united arab emirates"],
-    "us": ["united states", "usa"],
-    "united states": ["us", "usa", "america"],
-    "usa": ["united states", "us"],
-    "america": ["united states", "usa", "us"],
+ALIAS_MAP: dict[str, frozenset[str]] = {
+    "nyc": frozenset({"new york", "new york city"}),
+    "new york city": frozenset({"new york", "nyc"}),
+    "new york": frozenset({"nyc"}),
+    "dc": frozenset({"washington dc", "washington"}),
+    "washington dc": frozenset({"dc", "washington"}),
+    "la": frozenset({"los angeles"}),
+    "sf": frozenset({"san francisco"}),
+    "uk": frozenset({"united kingdom"}),
+    "uae": frozenset({"united arab emirates"}),
+    "us": frozenset({"united states", "usa"}),
+    "united states": frozenset({"us", "usa", "america"}),
+    "usa": frozenset({"united states", "us"}),
+    "america": frozenset({"united states", "usa", "us"}),
 }
+_ALIAS_KEYS = frozenset(ALIAS_MAP)
 
 logger = logging.getLogger("polyworld.api")
 if not logger.handlers:
@@ -59,6 +70,7 @@ class PlaceLookupRequest(BaseModel):
 
 
 ScopeType = Literal["poi", "city", "region", "country"]
+T = TypeVar("T")
 
 
 def parse_bool_env(value: str | None, default: bool = False) -> bool:
@@ -80,21 +92,43 @@ def parse_cors_origins(value: str | None) -> list[str]:
     return [origin.strip() for origin in value.split(",") if origin.strip()]
 
 
+_NON_TOKEN_RE = re.compile(r"[^a-z0-9\s]+")
+# Single-pass ASCII scrub: "&" expands to " and ", every other character outside
+# [a-z0-9] and whitespace becomes a space. Non-ASCII input still goes through
+# _NON_TOKEN_RE since the table only covers the first 128 code points.
+_ASCII_SCRUB_TABLE = str.maketrans(
+    {
+        char: " and " if char == "&" else " "
+        for char in map(chr, range(128))
+        if char not in string.ascii_lowercase and char not in string.digits and not char.isspace()
+    }
+)
+# Spaced-out abbreviations ("d c", "u s a", ...) collapsed in one pass; each
+# group name doubles as its replacement text.
+_ABBREVIATION_RE = re.compile(r"\b(?:(?P<dc>d c)|(?P<usa>u s a)|(?P<us>u s)|(?P<uk>u k)|(?P<uae>u a e))\b")
+
+
+def _collapse_abbreviation(match: re.Match[str]) -> str:
+    return match.lastgroup or match.group()
+
+
+@lru_cache(maxsize=65536)
 def normalize_text(value: str) -> str:
     """Normalize text for exact token matching."""
     cleaned = value.strip().lower()
-    cleaned = cleaned.replace("&", " and ")
-    cleaned = cleaned.replace(",", " ")
-    cleaned = cleaned.replace(".", " ")
-    cleaned = cleaned.replace("-", " ")
-    cleaned = re.sub(r"[^a-z0-9\s]", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned)
-    cleaned = re.sub(r"\bd\s+c\b", "dc", cleaned)
-    cleaned = re.sub(r"\bu\s+s\s+a\b", "usa", cleaned)
-    cleaned = re.sub(r"\bu\s+s\b", "us", cleaned)
-    cleaned = re.sub(r"\bu\s+k\b", "uk", cleaned)
-    cleaned = re.sub(r"\bu\s+a\s+e\b", "uae", cleaned)
-    return cleaned.strip()
+    if cleaned.isascii():
+        cleaned = cleaned.translate(_ASCII_SCRUB_TABLE)
+    else:
+        cleaned = _NON_TOKEN_RE.sub(" ", cleaned.replace("&", " and "))
+    cleaned = " ".join(cleaned.split())
+    return _ABBREVIATION_RE.sub(_collapse_abbreviation, cleaned)
+
+
+def expand_aliases(tokens: set[str]) -> None:
+    """Add alias spellings for any known tokens, in place (single level)."""
+    known = tokens & _ALIAS_KEYS
+    if known:
+        tokens.update(*(ALIAS_MAP[token] for token in known))
 
 
 def split_location_parts(location_name: str) -> list[str]:
@@ -102,19 +136,22 @@ def split_location_parts(location_name: str) -> list[str]:
     return [part.strip() for part in location_name.split(",") if part.strip()]
 
 
-def build_tokens_from_location(location_name: str) -> set[str]:
+@lru_cache(maxsize=65536)
+def build_tokens_from_location(location_name: str) -> frozenset[str]:
     """Build exact-match tokens from a location string."""
     parts = [normalize_text(part) for part in split_location_parts(location_name)]
     parts = [part for part in parts if part]
     if not parts:
-        return set()
+        return frozenset()
+    if len(parts) == 1:
+        return frozenset((parts[0], *ALIAS_MAP.get(parts[0], ())))
 
     tokens: set[str] = set(parts)
-    tokens.add(normalize_text(location_name))
 
-    # Add cumulative suffixes to catch city/state and city/country exact queries.
+    # Add cumulative suffixes to catch city/state and city/country exact queries;
+    # index 0 is the full name, joined from the already-normalized parts.
     # Example: "Building, Washington, DC" -> "washington dc"
-    for index in range(1, len(parts)):
+    for index in range(len(parts)):
         suffix = " ".join(parts[index:]).strip()
         if suffix:
             tokens.add(suffix)
@@ -125,11 +162,9 @@ def build_tokens_from_location(location_name: str) -> set[str]:
         if pair:
             tokens.add(pair)
 
-    for token in list(tokens):
-        for alias in ALIAS_MAP.get(token, []):
-            tokens.add(alias)
+    expand_aliases(tokens)
 
-    return {token for token in tokens if token}
+    return frozenset(token for token in tokens if token)
 
 
 def parse_locations(record: dict[str, Any]) -> list[str]:
@@ -187,12 +222,40 @@ def extract_market_coordinates(record: dict[str, Any]) -> list[dict[str, Any]]:
     return points
 
 
-@dataclass(slots=True)
-class MatchRef:
-    """Reference to a matched record and why it matched."""
+# Posting list for one token, stored column-wise: record indices alongside the
+# location string each record matched on.
+Postings = tuple["array[int]", list[str]]
 
-    index: int
-    matched_location: str
+
+# Bump when tokenization changes so persisted indexes from older code are rebuilt.
+INDEX_CACHE_VERSION = 2
+
+
+def new_postings() -> Postings:
+    """Create an empty posting list."""
+    return array("i"), []
+
+
+def build_postings(located: list[tuple[int, list[str]]]) -> dict[str, Postings]:
+    """Build token -> postings for (record index, location names) pairs."""
+    token_index: dict[str, Postings] = defaultdict(new_postings)
+    # Share one str object per distinct location name across all postings.
+    location_pool: dict[str, str] = {}
+    for idx, location_names in located:
+        for location_name in location_names:
+            location_name = location_pool.setdefault(location_name, location_name)
+            for token in build_tokens_from_location(location_name):
+                indices, matched_locations = token_index[token]
+                indices.append(idx)
+                matched_locations.append(location_name)
+    return token_index
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson, which is much faster on large result lists."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
 
 
 @dataclass(slots=True)
@@ -205,60 +268,130 @@ class ResolvedPlace:
     candidates: list[str]
 
 
+class ResolvedPlaceCache:
+    """Thread-safe LRU cache of Google resolutions whose entries expire after a TTL."""
+
+    def __init__(self, maxsize: int = 4096, ttl_seconds: float = 86400.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, ResolvedPlace]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> ResolvedPlace | None:
+        """Return a fresh cached resolution, dropping it if expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, place = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return place
+
+    def set(self, key: str, place: ResolvedPlace) -> None:
+        """Store a resolution, evicting the least recently used entries past maxsize."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, place)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A matched record and the location names it matched on."""
+
+    index: int
+    question: str
+    matched_on: list[str]
+
+
 class MarketIndex:
     """In-memory search index over geocoded market records."""
 
-    def __init__(self, records: list[dict[str, Any]]) -> None:
+    __slots__ = ("records", "questions", "token_index")
+
+    def __init__(self, records: list[dict[str, Any]], token_index: dict[str, Postings] | None = None) -> None:
         self.records = records
-        self.token_index: dict[str, list[MatchRef]] = defaultdict(list)
-        self._build()
-
-    def _build(self) -> None:
-        """Build token -> record references index."""
-        for idx, record in enumerate(self.records):
-            for location_name in parse_locations(record):
-                tokens = build_tokens_from_location(location_name)
-                for token in tokens:
-                    self.token_index[token].append(MatchRef(index=idx, matched_location=location_name))
-
-    def search(self, query: str) -> list[dict[str, Any]]:
-        """Return unique records that exactly match normalized query tokens."""
-        normalized_query = normalize_text(query)
-        if not normalized_query:
-            return []
+        self.questions = [str(record.get("question", "")).strip() for record in records]
+        self.token_index = token_index if token_index is not None else self._build()
+
+    def _build(self) -> dict[str, Postings]:
+        """Build token -> postings index.
+
+        Built serially in-process: set POLYWORLD_INDEX_CACHE_FILE to skip the
+        build on restarts instead.
+        """
+        # Records without a question can never be returned, so keep them out of postings.
+        located = [
+            (idx, parse_locations(record))
+            for idx, (record, question) in enumerate(zip(self.records, self.questions))
+            if question
+        ]
+        return build_postings(located)
 
-        refs = self.token_index.get(normalized_query, [])
-        if not refs:
-            return []
+    def search(self, query: str) -> list[tuple[int, str]]:
+        """Return raw (record index, matched location) postings for one query.
 
-        by_question: dict[str, dict[str, Any]] = {}
-        for ref in refs:
-            record = self.records[ref.index]
-            question = str(record.get("question", "")).strip()
-            if not question:
+        Question-level deduplication happens only in search_many/collect_hits.
+        """
+        normalized_query = normalize_text(query)
+        postings = self.token_index.get(normalized_query) if normalized_query else None
+        if postings is None:
+            return []
+        return list(zip(*postings))
+
+    def search_many(self, queries: Iterable[str]) -> list[SearchHit]:
+        """Return unique records matching any query, merged by question in one pass."""
+        by_question: dict[str, SearchHit] = {}
+        self.collect_hits(by_question, queries)
+        return [by_question[question] for question in sorted(by_question)]
+
+    def collect_hits(self, by_question: dict[str, SearchHit], queries: Iterable[str]) -> None:
+        """Merge hits for queries into by_question, so searches can run in stages."""
+        get_hit = by_question.get
+        questions = self.questions
+        for query in queries:
+            normalized_query = normalize_text(query)
+            if not normalized_query:
                 continue
 
-            existing = by_question.get(question)
-            if existing is None:
-                payload = dict(record)
-                payload["matched_on"] = [ref.matched_location]
-                by_question[question] = payload
-            else:
-                matched_on = existing.get("matched_on")
-                if not isinstance(matched_on, list):
-                    matched_on = []
-                if ref.matched_location not in matched_on:
-                    matched_on.append(ref.matched_location)
-                existing["matched_on"] = matched_on
-
-        return sorted(by_question.values(), key=lambda row: str(row.get("question", "")))
-
+            postings = self.token_index.get(normalized_query)
+            if postings is None:
+                continue
 
-def build_query_variants(query: str) -> list[str]:
+            for idx, matched_location in zip(*postings):
+                question = questions[idx]
+                existing = get_hit(question)
+                if existing is None:
+                    by_question[question] = SearchHit(index=idx, question=question, matched_on=[matched_location])
+                elif matched_location not in existing.matched_on:
+                    existing.matched_on.append(matched_location)
+
+    def to_rows(self, hits: list[SearchHit]) -> list[dict[str, Any]]:
+        """Materialize response rows for hits (copies each record once)."""
+        rows: list[dict[str, Any]] = []
+        records = self.records
+        for hit in hits:
+            payload = dict(records[hit.index])
+            payload["matched_on"] = hit.matched_on
+            rows.append(payload)
+        return rows
+
+
+@lru_cache(maxsize=65536)
+def build_query_variants(query: str) -> tuple[str, ...]:
     """Build exact variants for place matching."""
     normalized = normalize_text(query)
     if not normalized:
-        return []
+        return ()
+
+    # Common case: a single word such as "paris" is only itself plus its aliases.
+    if " " not in normalized and "," not in query:
+        aliases = ALIAS_MAP.get(normalized)
+        return tuple(sorted({normalized, *aliases})) if aliases else (normalized,)
 
     variants: set[str] = {normalized}
     parts = [part for part in normalized.split(" ") if part]
@@ -287,24 +420,24 @@ def build_query_variants(query: str) -> list[str]:
             if phrase:
                 variants.add(phrase)
 
-    for token in list(variants):
-        for alias in ALIAS_MAP.get(token, []):
-            variants.add(alias)
+    expand_aliases(variants)
 
-    return sorted({variant for variant in variants if variant})
+    return tuple(sorted({variant for variant in variants if variant}))
 
 
-def build_exact_query_variants(query: str) -> list[str]:
-    """Build conservative exact variants for strict location queries."""
+def build_exact_query_variants(query: str) -> tuple[str, list[str]]:
+    """Build conservative exact variants for strict location queries.
+
+    Returns the normalized query alongside its variants so callers need not
+    normalize it again.
+    """
     normalized = normalize_text(query)
     if not normalized:
-        return []
+        return normalized, []
 
-    variants: set[str] = {normalized}
-    for alias in ALIAS_MAP.get(normalized, []):
-        variants.add(alias)
+    variants: set[str] = {normalized, *ALIAS_MAP.get(normalized, ())}
 
-    return sorted({variant for variant in variants if variant})
+    return normalized, sorted({variant for variant in variants if variant})
 
 
 def infer_place_scope(place_types: list[str]) -> ScopeType:
@@ -351,42 +484,24 @@ def build_place_lookup_variants(place: PlaceLookupRequest, scope: ScopeType) ->
 
     variants: set[str] = set()
     for seed in seeds:
-        for variant in build_exact_query_variants(seed):
+        _, seed_variants = build_exact_query_variants(seed)
+        for variant in seed_variants:
             if variant:
                 variants.add(variant)
 
     return sorted(variants)
 
 
-def paginate_rows(rows: list[dict[str, Any]], offset: int, limit: int) -> tuple[list[dict[str, Any]], bool]:
+def paginate_rows(rows: list[T], offset: int, limit: int) -> tuple[list[T], bool]:
     """Return paginated rows and has_more indicator."""
     sliced = rows[offset : offset + limit]
     has_more = offset + limit < len(rows)
     return sliced, has_more
 
 
-def merge_result_groups(groups: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
-    """Merge result sets by question and combine matched_on values."""
-    by_question: dict[str, dict[str, Any]] = {}
-    for group in groups:
-        for row in group:
-            question = str(row.get("question", "")).strip()
-            if not question:
-                continue
-
-            existing = by_question.get(question)
-            if existing is None:
-                by_question[question] = dict(row)
-                continue
-
-            existing_matched = existing.get("matched_on")
-            row_matched = row.get("matched_on")
-            existing_list = existing_matched if isinstance(existing_matched, list) else []
-            row_list = row_matched if isinstance(row_matched, list) else []
-            merged = list(dict.fromkeys([*existing_list, *row_list]))
-            existing["matched_on"] = merged
-
-    return sorted(by_question.values(), key=lambda row: str(row.get("question", "")))
+# Google lookups run here so /markets can search the local index while the HTTP
+# call is in flight; the handler itself stays sync on FastAPI's threadpool.
+PLACE_LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="place-lookup")
 
 
 def fetch_json(url: str, timeout_seconds: float = 5.0) -> dict[str, Any]:
@@ -480,9 +595,7 @@ def resolve_place_with_google(query: str, api_key: str) -> ResolvedPlace | None:
                 candidates.add(normalize_text(candidate))
 
     # Expand aliases once more from resolved candidates.
-    for token in list(candidates):
-        for alias in ALIAS_MAP.get(token, []):
-            candidates.add(alias)
+    expand_aliases(candidates)
 
     normalized_candidates = sorted({token for token in candidates if token})
     return ResolvedPlace(
@@ -495,8 +608,60 @@ def resolve_place_with_google(query: str, api_key: str) -> ResolvedPlace | None:
 
 def read_json(path: Path) -> Any:
     """Read JSON from disk."""
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return orjson.loads(path.read_bytes())
+
+
+def index_source_fingerprint(*paths: Path) -> tuple[Any, ...]:
+    """Identify index inputs by path, size and mtime for cache invalidation."""
+    parts: list[Any] = [INDEX_CACHE_VERSION]
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            parts.append((str(path), None, None))
+            continue
+        parts.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(parts)
+
+
+def load_token_index(path: Path, fingerprint: tuple[Any, ...]) -> dict[str, Postings] | None:
+    """Load a persisted token index if it was built from the same inputs.
+
+    The file is unpickled, which can execute arbitrary code: the path comes from
+    POLYWORLD_INDEX_CACHE_FILE and must point somewhere only this service writes.
+    """
+    if not path.exists():
+        return None
+
+    try:
+        with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            payload = pickle.loads(mapped)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("ignoring unreadable index cache %s: %s", path, exc)
+        return None
+
+    if not isinstance(payload, dict) or payload.get("fingerprint") != fingerprint:
+        return None
+    token_index = payload.get("token_index")
+    return token_index if isinstance(token_index, dict) else None
+
+
+def save_token_index(path: Path, fingerprint: tuple[Any, ...], token_index: dict[str, Postings]) -> None:
+    """Persist token index atomically; failures are logged, never raised."""
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("wb") as handle:
+            pickle.dump(
+                {"fingerprint": fingerprint, "token_index": dict(token_index)},
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        temp_path.replace(path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as exc:
+        # TypeError/AttributeError are what pickle raises for unpicklable objects.
+        temp_path.unlink(missing_ok=True)
+        logger.warning("failed to write index cache %s: %s", path, exc)
 
 
 def load_records(data_path: Path, cache_path: Path) -> tuple[list[dict[str, Any]], str]:
@@ -514,7 +679,7 @@ def load_records(data_path: Path, cache_path: Path) -> tuple[list[dict[str, Any]
                 question = item.get("question")
                 if not isinstance(question, str) or not question.strip():
                     continue
-                records_by_question[question] = dict(item)
+                records_by_question[question] = item
 
     if cache_path.exists():
         cache_payload = read_json(cache_path)
@@ -570,7 +735,7 @@ def load_records(data_path: Path, cache_path: Path) -> tuple[list[dict[str, Any]
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    app = FastAPI(title="Polyworld Markets API", version="0.1.0")
+    app = FastAPI(title="Polyworld Markets API", version="0.1.0", default_response_class=OrjsonResponse)
 
     allow_origins = parse_cors_origins(os.getenv("POLYWORLD_CORS_ORIGINS"))
     allow_credentials = parse_bool_env(os.getenv("POLYWORLD_CORS_ALLOW_CREDENTIALS"), default=False)
@@ -590,8 +755,16 @@ def create_app() -> FastAPI:
     data_path = Path(os.getenv("POLYWORLD_RESULTS_FILE", project_root / "polymarket_all_results.json"))
     cache_path = Path(os.getenv("POLYWORLD_CACHE_FILE", project_root / ".geolocate_cache.json"))
 
+    index_cache_value = os.getenv("POLYWORLD_INDEX_CACHE_FILE", "").strip()
+    index_cache_path = Path(index_cache_value) if index_cache_value else None
+
     records, source_file = load_records(data_path, cache_path)
-    index = MarketIndex(records)
+    fingerprint = index_source_fingerprint(data_path, cache_path)
+    token_index = load_token_index(index_cache_path, fingerprint) if index_cache_path is not None else None
+    index = MarketIndex(records, token_index=token_index)
+    if index_cache_path is not None and token_index is None:
+        save_token_index(index_cache_path, fingerprint, index.token_index)
+    place_cache = ResolvedPlaceCache()
 
     @app.get("/health")
     def health() -> dict[str, Any]:
@@ -621,18 +794,28 @@ def create_app() -> FastAPI:
         if not q:
             raise HTTPException(status_code=400, detail="query is required")
 
-        variants = build_query_variants(q)
-        groups = [index.search(variant) for variant in variants]
-
+        # Submit the Google lookup first so it overlaps the local search.
         maps_key = os.getenv("GOOGLE_MAPS_API_KEY", "").strip()
         resolved_place: ResolvedPlace | None = None
+        lookup: Future[ResolvedPlace | None] | None = None
+        place_key = normalize_text(q)
         if maps_key:
-            resolved_place = resolve_place_with_google(q, maps_key)
+            resolved_place = place_cache.get(place_key)
+            if resolved_place is None:
+                lookup = PLACE_LOOKUP_EXECUTOR.submit(resolve_place_with_google, q, maps_key)
+
+        variants = build_query_variants(q)
+        by_question: dict[str, SearchHit] = {}
+        index.collect_hits(by_question, variants)
+
+        if lookup is not None:
+            resolved_place = lookup.result()
             if resolved_place is not None:
-                google_groups = [index.search(variant) for variant in resolved_place.candidates]
-                groups.extend(google_groups)
+                place_cache.set(place_key, resolved_place)
+        if resolved_place is not None:
+            index.collect_hits(by_question, resolved_place.candidates)
 
-        results = merge_result_groups(groups)
+        results = index.to_rows([by_question[question] for question in sorted(by_question)])
         return {
             "query": q,
             "count": len(results),
@@ -659,36 +842,34 @@ def create_app() -> FastAPI:
         if not raw:
             raise HTTPException(status_code=400, detail="location is required")
 
-        exact_variants = build_exact_query_variants(raw)
-        exact_groups = [index.search(variant) for variant in exact_variants]
-        exact_results = merge_result_groups(exact_groups)
+        normalized_location, exact_variants = build_exact_query_variants(raw)
+        exact_hits = index.search_many(exact_variants)
 
         mode = "exact"
         used_variants = exact_variants
-        all_results = exact_results
+        all_hits = exact_hits
 
-        paged_results, has_more = paginate_rows(all_results, offset=offset, limit=limit)
+        paged_hits, has_more = paginate_rows(all_hits, offset=offset, limit=limit)
+        paged_results = index.to_rows(paged_hits)
         logger.info(
             "events lookup location=%s strict=%s mode=%s count=%s offset=%s limit=%s",
             raw,
             True,
             mode,
-            len(all_results),
+            len(all_hits),
             offset,
             limit,
         )
-        for row in paged_results:
-            question = str(row.get("question", "")).strip()
-            if question:
-                logger.info("matched event: %s", question)
+        for hit in paged_hits:
+            logger.info("matched event: %s", hit.question)
 
         return {
             "location": raw,
-            "normalized_location": normalize_text(raw),
+            "normalized_location": normalized_location,
             "mode": mode,
             "strict": True,
             "used_variants": used_variants,
-            "count": len(all_results),
+            "count": len(all_hits),
             "limit": limit,
             "offset": offset,
             "has_more": has_more,
@@ -703,8 +884,8 @@ def create_app() -> FastAPI:
 
         scope = infer_place_scope(place.place_type)
         variants = build_place_lookup_variants(place, scope)
-        groups = [index.search(variant) for variant in variants]
-        results = merge_result_groups(groups)
+        hits = index.search_many(variants)
+        results = index.to_rows(hits)
 
         logger.info(
             "events by-place scope=%s name=%s variants=%s count=%s",
@@ -713,10 +894,8 @@ def create_app() -> FastAPI:
             variants,
             len(results),
         )
-        for row in results:
-            question = str(row.get("question", "")).strip()
-            if question:
-                logger.info("matched event: %s", question)
+        for hit in hits:
+            logger.info("matched event: %s", hit.question)
 
         return {
             "place_name": display_name,
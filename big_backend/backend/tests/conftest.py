@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import create_app
+
+
+SAMPLE_RESULTS = [
+    {
+        "question": "Will there be a major event in New York City?",
+        "location_name": "New York City, New York, United States",
+        "latitude": 40.7128,
+        "longitude": -74.0060,
+    },
+    {
+        "question": "Will Austin host SXSW next year?",
+        "location_name": "Austin, Texas, United States",
+    },
+    {
+        "question": "Will MSG host a sold-out show this quarter?",
+        "location_name": "Madison Square Garden, New York City, New York, United States",
+    },
+    {
+        "question": "Will Alaska host an energy summit this year?",
+        "location_name": "Alaska, United States",
+    },
+    {
+        "question": "Will Maine host a fishing summit this year?",
+        "location_name": "Maine, United States",
+    },
+    {
+        "question": "Will Seattle host a major conference?",
+        "location_name": "Seattle, Washington, United States",
+    },
+]
+
+SAMPLE_CACHE = {
+    "Will Dallas host a new event?": {
+        "location_name": "Dallas, Texas, United States",
+        "latitude": 32.7767,
+        "longitude": -96.797,
+    }
+}
+
+# Encoded once at import; fixtures write these bytes as-is.
+SAMPLE_RESULTS_JSON = json.dumps(SAMPLE_RESULTS).encode("utf-8")
+SAMPLE_CACHE_JSON = json.dumps(SAMPLE_CACHE).encode("utf-8")
+
+
+TEST_ENV = {
+    "POLYWORLD_CORS_ORIGINS": "http://localhost:5173",
+    "POLYWORLD_CORS_ALLOW_CREDENTIALS": "false",
+}
+
+
+@pytest.fixture(scope="session")
+def sample_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    data_dir = tmp_path_factory.mktemp("polyworld")
+    (data_dir / "results.json").write_bytes(SAMPLE_RESULTS_JSON)
+    (data_dir / "cache.json").write_bytes(SAMPLE_CACHE_JSON)
+    return data_dir
+
+
+@pytest.fixture(scope="session")
+def api_client(sample_data_dir: Path) -> Iterator[TestClient]:
+    """One app (and one index build) shared by every test in the session."""
+    # The built-in monkeypatch fixture is function-scoped, so drive one by hand.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for key, value in TEST_ENV.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.setenv("POLYWORLD_RESULTS_FILE", str(sample_data_dir / "results.json"))
+        monkeypatch.setenv("POLYWORLD_CACHE_FILE", str(sample_data_dir / "cache.json"))
+        yield TestClient(create_app())
@@ -0,0 +1,351 @@
+import asyncio
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import httpx2
+import pytest
+
+import geolocate
+
+
+GOOD_PAYLOAD = {
+    "entity": "Madison Square Garden",
+    "reasoning": "The event is held at MSG.",
+    "location_name": "Madison Square Garden, New York, NY",
+    "latitude": 40.7505,
+    "longitude": -73.9934,
+    "category": "entertainment",
+}
+
+
+def batch_output_line(question: str, content: Any = None, **overrides: Any) -> str:
+    row: dict[str, Any] = {
+        "custom_id": geolocate.batch_custom_id(question),
+        "error": None,
+        "response": {
+            "status_code": 200,
+            "body": {"choices": [{"message": {"content": json.dumps(GOOD_PAYLOAD) if content is None else content}}]},
+        },
+    }
+    row.update(overrides)
+    return json.dumps(row)
+
+
+def test_batch_custom_id_is_stable_and_distinct() -> None:
+    assert geolocate.batch_custom_id("Will A?") == geolocate.batch_custom_id("Will A?")
+    assert geolocate.batch_custom_id("Will A?") != geolocate.batch_custom_id("Will B?")
+
+
+def test_build_batch_request_mirrors_live_call() -> None:
+    request = geolocate.build_batch_request("gpt-test", "Will A?")
+    assert request["custom_id"] == geolocate.batch_custom_id("Will A?")
+    assert request["method"] == "POST"
+    assert request["url"] == "/v1/chat/completions"
+    body = request["body"]
+    assert body["model"] == "gpt-test"
+    assert body["response_format"] == {"type": "json_object"}
+    assert body["messages"] == [geolocate.SYSTEM_MESSAGE, {"role": "user", "content": "Will A?"}]
+    # Rows are written as JSON lines, so the request must serialize cleanly.
+    assert json.loads(geolocate.dumps_json(request)) == request
+
+
+def test_parse_batch_output_line_returns_output_row() -> None:
+    question = "Will MSG sell out?"
+    parsed = geolocate.parse_batch_output_line(
+        batch_output_line(question), {geolocate.batch_custom_id(question): question}
+    )
+    assert parsed is not None
+    parsed_question, result = parsed
+    assert parsed_question == question
+    assert result["question"] == question
+    assert result["location_name"] == GOOD_PAYLOAD["location_name"]
+    assert result["source"] == "llm"
+    assert "error" not in result
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "not json",
+        '{"custom_id": "trunc',
+        "[1, 2, 3]",
+        '"just a string"',
+        "null",
+        '{"custom_id": ["unhashable"]}',
+        batch_output_line("Will MSG sell out?", response="oops"),
+        batch_output_line("Will MSG sell out?", response={"status_code": 200, "body": None}),
+        batch_output_line("Will MSG sell out?", response={"status_code": 500}),
+        batch_output_line("Will MSG sell out?", error={"message": "failed"}),
+        batch_output_line("Will MSG sell out?", content="not json either"),
+        batch_output_line("Will MSG sell out?", content=json.dumps({"entity": "missing fields"})),
+        batch_output_line("Someone else's question?"),
+    ],
+)
+def test_parse_batch_output_line_skips_bad_rows(line: str) -> None:
+    question = "Will MSG sell out?"
+    assert geolocate.parse_batch_output_line(line, {geolocate.batch_custom_id(question): question}) is None
+
+
+def test_sqlite_cache_mapping_operations(tmp_path: Path) -> None:
+    cache = geolocate.load_cache(str(tmp_path / "cache.sqlite"))
+    assert isinstance(cache, geolocate.SqliteCache)
+    cache["Will A?"] = GOOD_PAYLOAD
+    cache["Will B?"] = {**GOOD_PAYLOAD, "location_name": "Zürich"}
+    cache["Will A?"] = {**GOOD_PAYLOAD, "entity": "Updated"}
+
+    assert cache["Will A?"]["entity"] == "Updated"
+    assert cache["Will B?"]["location_name"] == "Zürich"
+    assert "Will A?" in cache and "Will C?" not in cache and 42 not in cache
+    assert sorted(cache) == ["Will A?", "Will B?"]
+    assert len(cache) == 2
+    del cache["Will B?"]
+    with pytest.raises(KeyError):
+        cache["Will B?"]
+    with pytest.raises(KeyError):
+        del cache["Will B?"]
+    assert cache.get("Will B?") is None
+    cache.connection.close()
+
+
+def test_sqlite_cache_rows_are_digest_keyed_and_survive_reopen(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    cache = geolocate.SqliteCache(path)
+    cache["Will A?"] = GOOD_PAYLOAD
+    cache.connection.close()
+
+    with closing(sqlite3.connect(path)) as connection:
+        (schema,) = connection.execute("SELECT sql FROM sqlite_master WHERE name = 'entries'").fetchone()
+        rows = connection.execute("SELECT key, question FROM entries").fetchall()
+    assert "WITHOUT ROWID" in schema
+    assert rows == [(geolocate.cache_key("Will A?"), "Will A?")]
+    assert len(rows[0][0]) == 16
+
+    reopened = geolocate.SqliteCache(path)
+    assert reopened["Will A?"] == GOOD_PAYLOAD
+    assert len(reopened) == 1
+    reopened.connection.close()
+
+
+def payload_for(name: str) -> dict[str, Any]:
+    return {**GOOD_PAYLOAD, "entity": name}
+
+
+def test_cache_log_round_trip_leaves_snapshot_untouched(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_bytes(geolocate.dumps_json({"Will A?": payload_for("A")}, indent=True))
+    snapshot = cache_path.read_bytes()
+
+    cache = geolocate.load_cache(str(cache_path))
+    geolocate.record_cache_entry(str(cache_path), cache, "Will B?", payload_for("B"))
+    geolocate.record_cache_entry(str(cache_path), cache, "Will A?", payload_for("A2"))
+
+    assert cache_path.read_bytes() == snapshot
+    log_path = geolocate.cache_log_path(cache_path)
+    assert len(log_path.read_bytes().splitlines()) == 2
+    # The log replays over the snapshot, last write winning.
+    assert geolocate.load_cache(str(cache_path)) == {"Will A?": payload_for("A2"), "Will B?": payload_for("B")}
+
+
+def test_cache_log_torn_last_line_is_skipped_and_terminated(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    cache = geolocate.load_cache(str(cache_path))
+    geolocate.record_cache_entry(str(cache_path), cache, "Will A?", payload_for("A"))
+    log_path = geolocate.cache_log_path(cache_path)
+    with log_path.open("ab") as handle:
+        handle.write(b'{"question": "Will B?", "payl')
+
+    assert geolocate.load_cache(str(cache_path)) == {"Will A?": payload_for("A")}
+
+    # The next append must not be glued onto the torn line.
+    geolocate.record_cache_entry(str(cache_path), {}, "Will C?", payload_for("C"))
+    assert geolocate.load_cache(str(cache_path)) == {"Will A?": payload_for("A"), "Will C?": payload_for("C")}
+
+
+def test_compact_cache_folds_log_into_snapshot_past_threshold(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    big = {f"Will {index}?": payload_for(str(index)) for index in range(40)}
+    geolocate.save_cache(str(cache_path), big)
+    log_path = geolocate.cache_log_path(cache_path)
+
+    cache = geolocate.load_cache(str(cache_path))
+    geolocate.record_cache_entry(str(cache_path), cache, "Will new?", payload_for("new"))
+    geolocate.compact_cache_if_needed(str(cache_path), cache)
+    assert log_path.exists(), "a log below the size threshold is kept"
+
+    for index in range(40):
+        geolocate.record_cache_entry(str(cache_path), cache, f"Will more {index}?", payload_for("more"))
+    geolocate.compact_cache_if_needed(str(cache_path), cache)
+    assert not log_path.exists()
+
+    reloaded = geolocate.load_cache(str(cache_path))
+    assert reloaded == cache
+    assert len(reloaded) == 81
+    assert geolocate.load_cache_snapshot(cache_path, verbose=False) == reloaded
+
+
+def test_save_cache_removes_log(tmp_path: Path) -> None:
+    cache_path = tmp_path / "nested" / "cache.json"
+    cache = geolocate.load_cache(str(cache_path))
+    geolocate.record_cache_entry(str(cache_path), cache, "Will A?", payload_for("A"))
+    geolocate.save_cache(str(cache_path), cache)
+
+    assert not geolocate.cache_log_path(cache_path).exists()
+    assert not cache_path.with_suffix(".json.tmp").exists()
+    assert geolocate.load_cache(str(cache_path)) == {"Will A?": payload_for("A")}
+
+
+class FakeCompletions:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        self.calls += 1
+        content = json.dumps(payload_for(kwargs["messages"][-1]["content"]))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def run_batch(
+    tmp_path: Path,
+    cache_path: Path,
+    questions: list[str],
+    completions: FakeCompletions,
+    *extra_args: str,
+    **client_attrs: Any,
+) -> int:
+    questions_path = tmp_path / "questions.txt"
+    questions_path.write_text("\n".join(questions) + "\n", encoding="utf-8")
+    args = geolocate.parse_args(
+        ["--file", str(questions_path), "--cache", str(cache_path), "-o", str(tmp_path / "out.json"), *extra_args]
+    )
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions), **client_attrs)
+    return asyncio.run(geolocate.run_batch(args, client))  # type: ignore[arg-type]
+
+
+def test_run_batch_logs_new_entries_before_final_save(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_path = tmp_path / "cache.json"
+    completions = FakeCompletions()
+
+    # Simulate a crash before the final snapshot write: the log alone must hold the results.
+    def crash(*args: object) -> None:
+        raise RuntimeError("crashed before save")
+
+    monkeypatch.setattr(geolocate, "save_cache", crash)
+    with pytest.raises(RuntimeError):
+        run_batch(tmp_path, cache_path, ["Will A?", "Will B?", "Will A?"], completions)
+    monkeypatch.undo()
+
+    assert completions.calls == 2
+    assert not cache_path.exists()
+    recovered = geolocate.load_cache(str(cache_path))
+    assert {question: payload["entity"] for question, payload in recovered.items()} == {
+        "Will A?": "Will A?",
+        "Will B?": "Will B?",
+    }
+
+    # A clean rerun serves both from the replayed log, and its final save folds the
+    # log and the new entry into the snapshot.
+    assert run_batch(tmp_path, cache_path, ["Will A?", "Will B?", "Will C?"], completions) == 0
+    assert completions.calls == 3
+    assert not geolocate.cache_log_path(cache_path).exists()
+    snapshot = geolocate.load_cache_snapshot(cache_path, verbose=False)
+    assert sorted(snapshot) == ["Will A?", "Will B?", "Will C?"]
+
+
+def test_rate_limit_gate_hooks_pause_requests_on_sdk_client() -> None:
+    gate = geolocate.RateLimitGate()
+    statuses = iter([429, 200])
+    sent_at: list[float] = []
+
+    def respond(request: httpx2.Request) -> httpx2.Response:
+        sent_at.append(time.monotonic())
+        return httpx2.Response(next(statuses), headers={"retry-after": "0.2"})
+
+    async def send_two() -> list[int]:
+        # The same client class async_main builds, so the hooks receive its Request/Response types.
+        async with geolocate.DefaultAsyncHttpxClient(
+            transport=httpx2.MockTransport(respond),
+            event_hooks={"request": [gate.on_request], "response": [gate.on_response]},
+        ) as client:
+            first = await client.get("https://api.example/v1")
+            second = await client.get("https://api.example/v1")
+        return [first.status_code, second.status_code]
+
+    assert asyncio.run(send_two()) == [429, 200]
+    assert sent_at[1] - sent_at[0] >= 0.19
+
+
+def test_run_batch_falls_back_to_live_requests_when_batch_api_fails(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.json"
+    geolocate.save_cache(str(cache_path), {"Will A?": payload_for("cached")})
+    completions = FakeCompletions()
+
+    async def create_file(**kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(id="file-1")
+
+    async def create_batch(**kwargs: Any) -> SimpleNamespace:
+        request = httpx2.Request("POST", "https://api.openai.com/v1/batches")
+        raise geolocate.APIError("batch quota exceeded", request, body=None)
+
+    exit_code = run_batch(
+        tmp_path,
+        cache_path,
+        ["Will A?", "Will B?", "Will C?"],
+        completions,
+        "--batch-api",
+        files=SimpleNamespace(create=create_file),
+        batches=SimpleNamespace(create=create_batch),
+    )
+
+    assert exit_code == 0
+    assert completions.calls == 2
+    rows = json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+    assert [row["entity"] for row in rows] == ["cached", "Will B?", "Will C?"]
+    assert not any("error" in row for row in rows)
+
+
+class FlakyCompletions:
+    """Fails with a connection error `failures` times, then answers with a more specific location."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise geolocate.APIConnectionError(request=httpx2.Request("POST", "https://api.openai.com/v1/chat"))
+        content = json.dumps({**GOOD_PAYLOAD, "category": "sports"})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeClient:
+    def __init__(self, completions: FlakyCompletions) -> None:
+        self.completions = completions
+        self.option_calls: list[dict[str, Any]] = []
+
+    def with_options(self, **options: Any) -> SimpleNamespace:
+        self.option_calls.append(options)
+        return SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+
+@pytest.mark.parametrize(("failures", "max_retries", "refined"), [(2, 3, True), (3, 3, False), (0, 1, True)])
+def test_refine_result_retries_follow_max_retries_without_sdk_retries(
+    monkeypatch: pytest.MonkeyPatch, failures: int, max_retries: int, refined: bool
+) -> None:
+    monkeypatch.setattr(geolocate, "compute_rate_limit_delay", lambda attempt, exc=None: 0.0)
+    completions = FlakyCompletions(failures)
+    client = FakeClient(completions)
+    generic = {**GOOD_PAYLOAD, "location_name": "New York", "category": "sports", "locations": [], "question": "Q?"}
+
+    result = asyncio.run(
+        geolocate.refine_result(client, "gpt-test", "Q?", generic, max_retries, verbose=False)  # type: ignore[arg-type]
+    )
+
+    assert client.option_calls == [{"max_retries": 0}]
+    assert completions.calls == min(failures + 1, max_retries)
+    assert result["location_name"] == (GOOD_PAYLOAD["location_name"] if refined else "New York")
@@ -0,0 +1,69 @@
+import logging
+import pickle
+from pathlib import Path
+
+import pytest
+
+import app
+from app import MarketIndex
+
+
+def make_records(count: int) -> list[dict[str, object]]:
+    places = [
+        "New York City, New York, United States",
+        "Washington, D.C., United States",
+        "Austin, Texas, United States",
+        "London, United Kingdom",
+        "Dubai, U.A.E.",
+    ]
+    records: list[dict[str, object]] = []
+    for idx in range(count):
+        record: dict[str, object] = {
+            "question": f"Question {idx}?" if idx % 7 else "",
+            "location_name": places[idx % len(places)],
+        }
+        if idx % 3 == 0:
+            record["locations"] = [{"location_name": places[(idx + 1) % len(places)]}]
+        records.append(record)
+    return records
+
+
+def test_build_skips_questionless_records_and_keeps_postings_sorted() -> None:
+    records = make_records(200)
+    token_index = MarketIndex(records).token_index
+
+    indices, locations = token_index["dubai"]
+    assert indices.tolist() == sorted(indices.tolist())
+    assert all(records[idx]["question"] for idx in indices)
+    assert len(indices) == len(locations)
+    # Every 7th record has no question and can never be returned.
+    assert not any(idx % 7 == 0 for postings in token_index.values() for idx in postings[0])
+
+
+def test_save_token_index_survives_pickling_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    index_path = tmp_path / "index.pickle"
+
+    def fail_dump(*args: object, **kwargs: object) -> None:
+        raise pickle.PicklingError("cannot pickle")
+
+    monkeypatch.setattr(app.pickle, "dump", fail_dump)
+    with caplog.at_level(logging.WARNING, logger="polyworld.api"):
+        app.save_token_index(index_path, ("fp",), {})
+
+    assert "failed to write index cache" in caplog.text
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_token_index_round_trip_and_fingerprint_mismatch(tmp_path: Path) -> None:
+    index_path = tmp_path / "index.pickle"
+    token_index = MarketIndex(make_records(20)).token_index
+    app.save_token_index(index_path, ("fp", 1), token_index)
+
+    loaded = app.load_token_index(index_path, ("fp", 1))
+    assert loaded is not None
+    assert {token: (i.tolist(), l) for token, (i, l) in loaded.items()} == {
+        token: (i.tolist(), l) for token, (i, l) in token_index.items()
+    }
+    assert app.load_token_index(index_path, ("fp", 2)) is None
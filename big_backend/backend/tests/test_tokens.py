@@ -0,0 +1,83 @@
+import random
+import re
+
+import pytest
+
+from app import build_tokens_from_location, normalize_text
+
+
+def legacy_normalize_text(value: str) -> str:
+    """The original replace/re.sub chain that normalize_text must stay equivalent to."""
+    cleaned = value.strip().lower()
+    cleaned = cleaned.replace("&", " and ")
+    cleaned = cleaned.replace(",", " ")
+    cleaned = cleaned.replace(".", " ")
+    cleaned = cleaned.replace("-", " ")
+    cleaned = re.sub(r"[^a-z0-9\s]", " ", cleaned)
+    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = re.sub(r"\bd\s+c\b", "dc", cleaned)
+    cleaned = re.sub(r"\bu\s+s\s+a\b", "usa", cleaned)
+    cleaned = re.sub(r"\bu\s+s\b", "us", cleaned)
+    cleaned = re.sub(r"\bu\s+k\b", "uk", cleaned)
+    cleaned = re.sub(r"\bu\s+a\s+e\b", "uae", cleaned)
+    return cleaned.strip()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Washington, D.C.", "washington dc"),
+        ("U.S.A.", "usa"),
+        ("u.s.", "us"),
+        ("U.K.", "uk"),
+        ("U.A.E", "uae"),
+        ("d c u s", "dc us"),
+        ("Trinidad & Tobago", "trinidad and tobago"),
+        ("A&B", "a and b"),
+        ("  New-York!!  ", "new york"),
+        ("St. John's", "st john s"),
+        ("\tfoo\x1cbar", "foo bar"),
+        ("São Paulo", "s o paulo"),
+        ("Zürich—Old Town", "z rich old town"),
+        ("İstanbul", "i stanbul"),
+        ("", ""),
+        ("...", ""),
+    ],
+)
+def test_normalize_text_examples(value: str, expected: str) -> None:
+    assert normalize_text(value) == expected
+    assert legacy_normalize_text(value) == expected
+
+
+def test_normalize_text_matches_legacy_chain() -> None:
+    rng = random.Random(7)
+    # Mixes abbreviation letters with the characters each fast path special-cases,
+    # plus non-ASCII characters that force the regex fallback.
+    alphabet = list("dcusakeb") + [" ", " ", ".", ",", "-", "&", "'", "\t", "\x1c", "é", "’", "İ"]
+    for _ in range(20_000):
+        value = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+        assert normalize_text(value) == legacy_normalize_text(value), repr(value)
+
+
+def test_build_tokens_single_part_adds_aliases() -> None:
+    assert build_tokens_from_location("NYC") == {"nyc", "new york", "new york city"}
+    assert build_tokens_from_location(" , ") == frozenset()
+
+
+def test_build_tokens_multi_part_suffixes_pairs_and_aliases() -> None:
+    tokens = build_tokens_from_location("Capitol Building, Washington, D.C.")
+    assert tokens == {
+        "capitol building",
+        "washington",
+        "dc",
+        "capitol building washington dc",
+        "washington dc",
+        "capitol building washington",
+    }
+
+
+def test_build_tokens_full_name_joins_normalized_parts() -> None:
+    tokens = build_tokens_from_location("Austin, Texas, U.S.")
+    assert "austin texas us" in tokens
+    assert {"us", "united states", "usa"} <= tokens
+    assert {"texas us", "austin texas"} <= tokens
@@ -1,83 +1,99 @@
 #!/usr/bin/env python3
-"""Extract questions and build question-to-URL mapping from allqslinks.txt."""
+"""Extract questions and build question-to-URL mapping from allqslinks.txt.
+
+Fully annotated so it can optionally be compiled with `mypyc extract_questions.py`
+for large inputs; `python extract_questions.py ...` then loads the compiled module.
+"""
 
 import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
 
-def parse_allqslinks(input_path: str) -> tuple[list[str], dict[str, str]]:
-    """Parse allqslinks.txt into questions list and question->URL mapping.
+def parse_allqslinks(input_path: str) -> dict[str, str]:
+    """Parse allqslinks.txt into a question->URL mapping.
     
     Format: "Question, URL" per line
     
     Returns:
-        (questions_list, question_url_map)
+        question_url_map, in first-seen question order (a repeated question
+        keeps its last URL)
     """
     path = Path(input_path)
     if not path.exists():
         print(f"Error: {input_path} not found", file=sys.stderr)
         sys.exit(1)
     
-    questions = []
-    url_map = {}
-    
-    with path.open('r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Split by finding the URL pattern (https://)
-            # Handle both "question?, https://..." and "question, https://..." formats
-            url_start = line.find(', https://')
-            
-            if url_start == -1:
-                # Try without question mark
-                url_start = line.find(' https://')
-                if url_start == -1:
-                    print(f"Warning: Line {line_num} malformed (no URL found), skipping: {line[:60]}", file=sys.stderr)
-                    continue
-                question = line[:url_start].strip()
-                url = line[url_start + 1:].strip()
-            else:
-                question = line[:url_start].strip()
-                url = line[url_start + 2:].strip()  # Skip ", "
-            
-            if not question or not url:
-                print(f"Warning: Line {line_num} has empty question or URL, skipping", file=sys.stderr)
-                continue
-            
-            questions.append(question)
-            url_map[question] = url
+    url_map: dict[str, str] = {}
     
-    return questions, url_map
+    # One read and one decode, then iterate in memory. split('\n') rather than
+    # splitlines() so only real line breaks separate records, as with file iteration.
+    lines = path.read_text(encoding='utf-8').split('\n')
+    for line_num, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Split on the URL pattern (https://) with one scan for " https://"
+        # Handle both "question?, https://..." and "question https://..." formats
+        url_start = line.find(' https://')
+        if url_start == -1:
+            print(f"Warning: Line {line_num} malformed (no URL found), skipping: {line[:60]}", file=sys.stderr)
+            continue
+        if line[url_start - 1] != ',':
+            # A ", https://" separator takes precedence even if it comes later
+            comma_start = line.find(', https://', url_start)
+            if comma_start != -1:
+                url_start = comma_start + 1
+        
+        # The line is already stripped, so the URL needs no further trimming
+        question_end = url_start - 1 if line[url_start - 1] == ',' else url_start
+        question = line[:question_end].strip()
+        url = line[url_start + 1:]
+        
+        if not question:
+            print(f"Warning: Line {line_num} has empty question or URL, skipping", file=sys.stderr)
+            continue
+        
+        url_map[question] = url
+
+    return url_map
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python extract_questions.py <allqslinks.txt>")
+def main() -> None:
+    args = [arg for arg in sys.argv[1:] if arg != '--pretty']
+    pretty = len(args) != len(sys.argv) - 1
+    if not args:
+        print("Usage: python extract_questions.py <allqslinks.txt> [--pretty]")
         sys.exit(1)
     
-    input_file = sys.argv[1]
+    input_file = args[0]
     
     print(f"Parsing {input_file}...", file=sys.stderr)
-    questions, url_map = parse_allqslinks(input_file)
+    url_map = parse_allqslinks(input_file)
     
-    print(f"Extracted {len(questions)} questions", file=sys.stderr)
-    print(f"Built URL map with {len(url_map)} entries", file=sys.stderr)
+    print(f"Extracted {len(url_map)} unique questions", file=sys.stderr)
     
     # Write questions_only.txt
     questions_file = Path(input_file).parent / "questions_only.txt"
-    with questions_file.open('w', encoding='utf-8') as f:
-        for q in questions:
-            f.write(q + '\n')
+    questions_file.write_text(''.join(q + '\n' for q in url_map), encoding='utf-8')
     print(f"Wrote {questions_file}", file=sys.stderr)
     
-    # Write question_url_map.json
+    # Write question_url_map.json (compact; it is machine-read, --pretty indents it)
     map_file = Path(input_file).parent / "question_url_map.json"
-    with map_file.open('w', encoding='utf-8') as f:
-        json.dump(url_map, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        map_file.write_bytes(orjson.dumps(url_map, option=orjson.OPT_INDENT_2 if pretty else None))
+    else:
+        with map_file.open('w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(url_map, f, ensure_ascii=False, indent=2)
+            else:
+                json.dump(url_map, f, ensure_ascii=False, separators=(',', ':'))
     print(f"Wrote {map_file}", file=sys.stderr)
     
     print("Done!", file=sys.stderr)
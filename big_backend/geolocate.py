@@ -4,22 +4,39 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
+import importlib.util
 import json
 import os
 import random
 import re
+import sqlite3
 import sys
+import time
+from collections.abc import Iterator, MutableMapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+# The openai SDK is built on httpx2 (installed with it); client options such as
+# Limits and the event-hook Request/Response types come from that package.
+import httpx2
 from openai import (
     APIConnectionError,
     APIError,
     APIStatusError,
     APITimeoutError,
     AsyncOpenAI,
+    DefaultAsyncHttpxClient,
     RateLimitError,
+    Timeout,
 )
+from openai.types.chat import ChatCompletionSystemMessageParam
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is used without it
+    orjson = None  # type: ignore[assignment]
 
 
 SYSTEM_PROMPT = """You are a geocoding engine for prediction market questions. Given a question, determine the most relevant real-world location and additional relevant locations whenever applicable, then return structured JSON. You must ALWAYS return valid JSON and nothing else - no markdown fences, no preamble, no commentary.
@@ -229,6 +246,12 @@ REQUIRED_FIELDS: tuple[str, ...] = (
 )
 
 LOCATION_ENTRY_FIELDS: tuple[str, ...] = ("location_name", "latitude", "longitude")
+REQUIRED_FIELD_SET: frozenset[str] = frozenset(REQUIRED_FIELDS)
+LOCATION_ENTRY_FIELD_SET: frozenset[str] = frozenset(LOCATION_ENTRY_FIELDS)
+
+# Exact JSON number types for coordinates; a type() lookup is cheaper than
+# isinstance and also rejects bool, which isinstance(x, int) would accept.
+NUMERIC_TYPES: frozenset[type] = frozenset({int, float})
 
 CATEGORIES: set[str] = {
     "sports",
@@ -243,6 +266,191 @@ CATEGORIES: set[str] = {
     "other",
 }
 
+# Categories whose rows are always location-free, whatever the question says.
+ALWAYS_NULL_CATEGORIES: frozenset[str] = frozenset({"crypto"})
+# Categories checked for price-threshold wording with no physical anchor.
+LOCATIONLESS_MARKET_CATEGORIES: frozenset[str] = frozenset({"crypto", "finance"})
+# Categories checked for broad planet-scale science wording.
+BROAD_SCIENCE_CATEGORIES: frozenset[str] = frozenset({"science", "natural_disaster"})
+
+# Compact the JSON cache's entry log once it exceeds this fraction of the snapshot size.
+CACHE_LOG_COMPACT_RATIO = 0.25
+# --file runs fsync the entry log once per this many new entries instead of per entry.
+CACHE_LOG_SYNC_EVERY = 50
+
+SQLITE_CACHE_SUFFIXES: frozenset[str] = frozenset({".sqlite", ".sqlite3", ".db"})
+
+BATCH_TERMINAL_STATUSES: frozenset[str] = frozenset({"completed", "failed", "expired", "cancelled"})
+BATCH_POLL_INITIAL_SECONDS = 10.0
+BATCH_POLL_MAX_SECONDS = 300.0
+
+# HTTP/2 multiplexes concurrent requests over a few connections, but httpx2 only
+# speaks it with the optional h2 package installed (`pip install "httpx2[http2]"`).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Completions are short, so fail a stalled read or connect well before the SDK's 10-minute default.
+OPENAI_HTTP_TIMEOUT = Timeout(60.0, connect=10.0)
+
+# How long RateLimitGate pauses all requests after a 429 without a Retry-After header.
+RATE_LIMIT_DEFAULT_PAUSE_SECONDS = 1.0
+
+# run_batch yields to the event loop after this many cached rows, so in-flight
+# API calls for cache misses progress while the cache is validated.
+CACHE_VALIDATION_YIELD_EVERY = 256
+# run_batch prints a progress line at most this often (plus once when all questions are done).
+PROGRESS_PRINT_INTERVAL_SECONDS = 0.5
+
+# Stable `user` tags derived from each system prompt. Requests sharing a prompt
+# prefix are routed alike, which keeps OpenAI's automatic prompt cache warm.
+SYSTEM_PROMPT_USER_TAG = "geolocate-" + hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:16]
+REFINEMENT_PROMPT_USER_TAG = "geolocate-" + hashlib.sha256(REFINEMENT_PROMPT.encode("utf-8")).hexdigest()[:16]
+
+# Scalar location fields of a result with no location; "locations" gets a fresh [] each time.
+NULL_LOCATION_FIELDS: dict[str, None] = {"location_name": None, "latitude": None, "longitude": None}
+
+# Key order of a failed result row; build_error_result copies it and fills in three fields.
+ERROR_RESULT_TEMPLATE: dict[str, Any] = dict.fromkeys(
+    (
+        "question",
+        "entity",
+        "reasoning",
+        "location_name",
+        "latitude",
+        "longitude",
+        "locations",
+        "category",
+        "link",
+        "source",
+        "error",
+    )
+)
+
+# Shared by reference in every request's messages list; never mutate.
+SYSTEM_MESSAGE: ChatCompletionSystemMessageParam = {"role": "system", "content": SYSTEM_PROMPT}
+REFINEMENT_SYSTEM_MESSAGE: ChatCompletionSystemMessageParam = {"role": "system", "content": REFINEMENT_PROMPT}
+
+# Each pattern list is compiled once into a single alternation, so a question is
+# scanned in one regex pass instead of once per pattern.
+LOCATIONLESS_MARKET_RE = re.compile(
+    "|".join(
+        [
+            r"\breach\s*\$?\d",
+            r"\bhit\s*\$?\d",
+            r"\bprice\b",
+            r"\btrading\s+above\b",
+            r"\btrading\s+below\b",
+            r"\babove\s*\$?\d",
+            r"\bbelow\s*\$?\d",
+        ]
+    )
+)
+
+GLOBAL_QUESTION_RE = re.compile(
+    "|".join(
+        [
+            r"\bglobal\b",
+            r"\bworldwide\b",
+            r"\bworld\b",
+            r"\bany country\b",
+            r"\bany nation\b",
+            r"\banywhere\b",
+            r"\bin the world\b",
+            r"\bworld war\b",
+            r"\bnew pandemic\b",
+            r"\bglobal pandemic\b",
+            r"\bglobal recession\b",
+            r"\bplanet\b",
+        ]
+    )
+)
+
+BROAD_SCIENCE_RE = re.compile(
+    "|".join(
+        [
+            r"\brecord\b",
+            r"\bwarmest\b",
+            r"\bhottest\b",
+            r"\bearthquake\b",
+            r"\btsunami\b",
+            r"\bvolcanic\b",
+        ]
+    )
+)
+
+
+def compile_substring_matcher(needles: list[str]) -> re.Pattern[str]:
+    """Compile plain substrings into one regex that finds any of them in a single scan."""
+    return re.compile("|".join(re.escape(needle) for needle in needles))
+
+
+# Substring markers (matched anywhere, like `marker in text`).
+SPECIFIC_MARKER_RE = compile_substring_matcher(
+    [
+        "stadium",
+        "arena",
+        "center",
+        "centre",
+        "building",
+        "palace",
+        "capitol",
+        "parliament",
+        "house",
+        "hq",
+        "headquarters",
+        "office",
+        "ministry",
+        "court",
+        "exchange",
+        "bank",
+        "district",
+        "street",
+        "avenue",
+        "road",
+        "boulevard",
+        "tower",
+        "campus",
+        "base",
+        "strait",
+        "gulf",
+        "sea",
+    ]
+)
+
+MULTI_LOCATION_SIGNAL_RE = compile_substring_matcher(
+    [
+        " vs ",
+        " x ",
+        " versus ",
+        " between ",
+        " and ",
+        " bilateral",
+        " coalition",
+        " alliance",
+        " trade deal",
+        " ceasefire",
+        " summit",
+        " finals",
+        " matchup",
+    ]
+)
+
+MILITARY_OR_POLICY_RE = compile_substring_matcher(
+    [
+        "military",
+        "clash",
+        "strike",
+        "war",
+        "invasion",
+        "attack",
+        "policy",
+        "bill",
+        "law",
+        "regulation",
+        "sanction",
+        "congress",
+        "parliament",
+    ]
+)
+
 
 class ValidationError(Exception):
     """Raised when model JSON does not meet output schema."""
@@ -252,6 +460,58 @@ class ValidationError(Exception):
         self.code = code
 
 
+class RateLimitGate:
+    """Holds back every outgoing API request once any request gets a 429.
+
+    Installed as request/response hooks on the shared HTTP client, so one
+    rate-limit response pauses all workers until its Retry-After has passed,
+    instead of each worker running into the limit with its own 429.
+    """
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+
+    async def on_request(self, request: httpx2.Request) -> None:
+        """HTTP client request hook: wait out any active pause."""
+        while (remaining := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(remaining)
+
+    async def on_response(self, response: httpx2.Response) -> None:
+        """HTTP client response hook: start or extend the pause on a 429."""
+        if response.status_code != 429:
+            return
+        retry_after = parse_retry_after(response.headers)
+        pause = retry_after if retry_after is not None else RATE_LIMIT_DEFAULT_PAUSE_SECONDS
+        self._resume_at = max(self._resume_at, time.monotonic() + pause)
+
+
+class RequestThrottle:
+    """Token bucket that spaces outgoing API requests to a requests-per-minute budget."""
+
+    def __init__(self, rpm: int) -> None:
+        self._rate = rpm / 60.0
+        self._capacity = max(1.0, self._rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    async def on_request(self, request: httpx2.Request) -> None:
+        """HTTP client request hook, so SDK-internal retries are throttled as well."""
+        await self.acquire()
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     """Parse and validate CLI arguments."""
     parser = argparse.ArgumentParser(description="Geolocate prediction market questions")
@@ -282,10 +542,16 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=20,
         help="Maximum concurrent API requests in batch mode (1-100)",
     )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=0,
+        help="Maximum API requests per minute across all workers (0 = unlimited)",
+    )
     parser.add_argument(
         "--cache",
         default=".geolocate_cache.json",
-        help='Cache file path, or "none" to disable',
+        help='Cache file path (a .sqlite/.sqlite3/.db suffix selects the SQLite cache), or "none" to disable',
     )
     parser.add_argument("--no-cache", action="store_true", help="Disable cache")
     parser.add_argument(
@@ -300,6 +566,11 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         action="store_true",
         help="Run interactive mode (continuous questions from stdin)",
     )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="In --file mode, submit cache misses via the OpenAI Batch API (slower turnaround, half price)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose stderr logs")
 
     args = parser.parse_args(argv)
@@ -314,6 +585,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         )
         raise SystemExit(1)
 
+    if args.batch_api and not has_file:
+        print("Error: --batch-api requires --file.", file=sys.stderr)
+        raise SystemExit(1)
+
     if args.concurrency < 1 or args.concurrency > 100:
         print("Error: --concurrency must be between 1 and 100.", file=sys.stderr)
         raise SystemExit(1)
@@ -322,6 +597,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         print("Error: --retry must be >= 1.", file=sys.stderr)
         raise SystemExit(1)
 
+    if args.rpm < 0:
+        print("Error: --rpm must be >= 0.", file=sys.stderr)
+        raise SystemExit(1)
+
     if args.no_cache or str(args.cache).lower() == "none":
         args.cache = None
 
@@ -349,20 +628,111 @@ def load_questions(file_path: str) -> list[str]:
         return [line.strip() for line in handle if line.strip()]
 
 
-def load_cache(cache_path: str | None, verbose: bool = False) -> dict[str, dict[str, Any]]:
-    """Load cache file into memory; return empty dict on missing/invalid."""
+def loads_json(data: str | bytes) -> Any:
+    """Decode JSON with orjson when installed (its errors subclass json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(payload: Any, indent: bool = False) -> bytes:
+    """Encode JSON as UTF-8 bytes (non-ASCII kept verbatim), optionally with 2-space indent."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def cache_key(question: str) -> bytes:
+    """Fixed-size 16-byte BLAKE2b digest of a question, used as the SQLite cache key."""
+    return hashlib.blake2b(question.encode("utf-8"), digest_size=16).digest()
+
+
+class SqliteCache(MutableMapping[str, dict[str, Any]]):
+    """Question -> cache payload mapping stored row-by-row in SQLite (WAL mode).
+
+    Lookups hit the primary-key index instead of loading the whole cache, and
+    every assignment is written immediately, so concurrent runs can share a file.
+    Rows are clustered on a 16-byte digest of the question (cache_key) rather than
+    the question text, so the key index stays small; the question is kept in its
+    own column for iteration.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key BLOB PRIMARY KEY, question TEXT NOT NULL, payload TEXT NOT NULL) WITHOUT ROWID"
+        )
+
+    def __getitem__(self, question: str) -> dict[str, Any]:
+        row = self.connection.execute("SELECT payload FROM entries WHERE key = ?", (cache_key(question),)).fetchone()
+        if row is None:
+            raise KeyError(question)
+        payload = loads_json(row[0])
+        if not isinstance(payload, dict):
+            raise KeyError(question)
+        return payload
+
+    def __setitem__(self, question: str, payload: dict[str, Any]) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries (key, question, payload) VALUES (?, ?, ?)",
+            (cache_key(question), question, dumps_json(payload).decode("utf-8")),
+        )
+
+    def __delitem__(self, question: str) -> None:
+        cursor = self.connection.execute("DELETE FROM entries WHERE key = ?", (cache_key(question),))
+        if cursor.rowcount == 0:
+            raise KeyError(question)
+
+    def __contains__(self, question: object) -> bool:
+        return (
+            isinstance(question, str)
+            and self.connection.execute("SELECT 1 FROM entries WHERE key = ?", (cache_key(question),)).fetchone()
+            is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return (row[0] for row in self.connection.execute("SELECT question FROM entries").fetchall())
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def load_cache(cache_path: str | None, verbose: bool = False) -> MutableMapping[str, dict[str, Any]]:
+    """Load cache file into memory; return empty dict on missing/invalid.
+
+    A .sqlite/.sqlite3/.db path opens a SqliteCache instead, which reads rows on demand.
+    """
     if cache_path is None:
         return {}
 
     path = Path(cache_path)
+    if path.suffix.lower() in SQLITE_CACHE_SUFFIXES:
+        try:
+            return SqliteCache(path)
+        except sqlite3.Error as exc:
+            print(f"Warning: failed to open cache {cache_path}: {exc}", file=sys.stderr)
+            return {}
+
+    cleaned = load_cache_snapshot(path, verbose)
+    replay_cache_log(cache_log_path(path), cleaned, verbose)
+    return cleaned
+
+
+def load_cache_snapshot(path: Path, verbose: bool) -> dict[str, dict[str, Any]]:
+    """Load the JSON cache snapshot; return empty dict on missing/invalid."""
     if not path.exists():
         return {}
 
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = loads_json(path.read_bytes())
     except Exception as exc:  # noqa: BLE001
-        print(f"Warning: failed to read cache {cache_path}: {exc}", file=sys.stderr)
+        print(f"Warning: failed to read cache {path}: {exc}", file=sys.stderr)
         return {}
 
     if not isinstance(payload, dict):
@@ -377,25 +747,110 @@ def load_cache(cache_path: str | None, verbose: bool = False) -> dict[str, dict[
     return cleaned
 
 
-def save_cache(cache_path: str | None, cache: dict[str, dict[str, Any]]) -> None:
-    """Persist cache atomically to disk."""
-    if cache_path is None:
+def cache_log_path(path: Path) -> Path:
+    """Append-only JSONL log of entries added since the JSON snapshot was last written."""
+    return path.with_name(path.name + ".log.jsonl")
+
+
+def replay_cache_log(log_path: Path, cache: dict[str, dict[str, Any]], verbose: bool) -> None:
+    """Apply logged entries on top of the snapshot (last write wins)."""
+    if not log_path.exists():
+        return
+
+    for line in log_path.read_bytes().splitlines():
+        try:
+            entry = loads_json(line)
+            question = entry["question"]
+            payload = entry["payload"]
+        except (ValueError, TypeError, KeyError):
+            # A crash can leave a torn final line; skip anything unreadable.
+            if verbose:
+                print(f"Warning: skipping unreadable line in {log_path}", file=sys.stderr)
+            continue
+        if isinstance(question, str) and isinstance(payload, dict):
+            cache[question] = payload
+
+
+def record_cache_entry(
+    cache_path: str | None,
+    cache: MutableMapping[str, dict[str, Any]],
+    question: str,
+    payload: dict[str, Any],
+) -> None:
+    """Store one entry durably without rewriting the JSON snapshot.
+
+    SqliteCache writes the row itself; a JSON cache gets one appended, fsynced
+    log line that load_cache replays until save_cache folds it into the snapshot.
+    """
+    cache[question] = payload
+    if cache_path is None or isinstance(cache, SqliteCache):
+        return
+
+    with open_cache_log(cache_path) as handle:
+        append_cache_log(handle, question, payload)
+        os.fsync(handle.fileno())
+
+
+def open_cache_log(cache_path: str) -> BinaryIO:
+    """Open a JSON cache's entry log for appending, terminating any torn last line."""
+    log_path = cache_log_path(Path(cache_path))
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    handle = log_path.open("a+b")
+    if handle.seek(0, os.SEEK_END) > 0:
+        handle.seek(-1, os.SEEK_END)
+        if handle.read(1) != b"\n":
+            # Terminate a torn line left by a crash so the next entry stays readable.
+            handle.write(b"\n")
+    return handle
+
+
+def append_cache_log(handle: BinaryIO, question: str, payload: dict[str, Any]) -> None:
+    """Append one entry line to an open cache log and flush it to the OS."""
+    handle.write(dumps_json({"question": question, "payload": payload}) + b"\n")
+    handle.flush()
+
+
+def compact_cache_if_needed(cache_path: str | None, cache: MutableMapping[str, dict[str, Any]]) -> None:
+    """Fold the log into a fresh snapshot once it outgrows CACHE_LOG_COMPACT_RATIO of the snapshot."""
+    if cache_path is None or isinstance(cache, SqliteCache):
+        return
+
+    path = Path(cache_path)
+    log_path = cache_log_path(path)
+    if not log_path.exists():
+        return
+    snapshot_size = path.stat().st_size if path.exists() else 0
+    if log_path.stat().st_size > snapshot_size * CACHE_LOG_COMPACT_RATIO:
+        save_cache(cache_path, cache)
+
+
+def save_cache(cache_path: str | None, cache: MutableMapping[str, dict[str, Any]]) -> None:
+    """Persist cache atomically to disk and drop the now-folded-in entry log.
+
+    A no-op for SqliteCache, which writes per entry.
+    """
+    if cache_path is None or isinstance(cache, SqliteCache):
         return
 
     path = Path(cache_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = path.with_suffix(path.suffix + ".tmp")
-    with temp_path.open("w", encoding="utf-8") as handle:
-        json.dump(cache, handle, ensure_ascii=False, indent=2)
+    temp_path.write_bytes(dumps_json(cache, indent=True))
     temp_path.replace(path)
+    cache_log_path(path).unlink(missing_ok=True)
 
 
 def strip_code_fences(text: str) -> str:
     """Strip markdown code fences and surrounding text if present."""
     stripped = text.strip()
-    if stripped.startswith("```"):
-        stripped = re.sub(r"^```(?:json)?\\s*", "", stripped, flags=re.IGNORECASE)
-        stripped = re.sub(r"\\s*```$", "", stripped)
+    if not stripped.startswith("```"):
+        return stripped
+
+    stripped = stripped[3:]
+    if stripped[:4].lower() == "json":
+        stripped = stripped[4:]
+    if stripped.endswith("```"):
+        stripped = stripped[:-3]
     return stripped.strip()
 
 
@@ -413,25 +868,32 @@ def parse_model_json(raw_text: str) -> dict[str, Any]:
     """Parse model response with recovery attempts."""
     first_attempt = raw_text.strip()
     try:
-        payload = json.loads(first_attempt)
+        payload = loads_json(first_attempt)
     except json.JSONDecodeError:
         second_attempt = extract_json_object(raw_text)
-        payload = json.loads(second_attempt)
+        payload = loads_json(second_attempt)
 
     if not isinstance(payload, dict):
         raise ValidationError("Model output is not a JSON object", "malformed_json")
     return payload
 
 
-def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
-    """Validate and normalize payload schema."""
-    missing = [field for field in REQUIRED_FIELDS if field not in payload]
-    if missing:
+def validate_payload(payload: dict[str, Any], expect_null: bool = False) -> dict[str, Any]:
+    """Validate and normalize payload schema.
+
+    With expect_null, the answer is known to be overridden to no location, so
+    only the scalar fields are checked and location fields come back null.
+    """
+    if not payload.keys() >= REQUIRED_FIELD_SET:
+        missing = [field for field in REQUIRED_FIELDS if field not in payload]
         raise ValidationError(f"Missing fields: {', '.join(missing)}", "incomplete_response")
 
-    location_name = payload.get("location_name")
-    lat = payload.get("latitude")
-    lon = payload.get("longitude")
+    if expect_null:
+        return validate_null_payload(payload)
+
+    location_name = payload["location_name"]
+    lat = payload["latitude"]
+    lon = payload["longitude"]
 
     if location_name is None and lat is None and lon is None:
         lat_f: float | None = None
@@ -440,12 +902,12 @@ def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
     else:
         if not isinstance(location_name, str):
             raise ValidationError("location_name must be string or null", "incomplete_response")
-        if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+        if type(lat) not in NUMERIC_TYPES or type(lon) not in NUMERIC_TYPES:
             raise ValidationError("Coordinates must be numeric", "incomplete_response")
 
         lat_f = round(float(lat), 4)
         lon_f = round(float(lon), 4)
-        if lat_f < -90.0 or lat_f > 90.0 or lon_f < -180.0 or lon_f > 180.0:
+        if not (-90.0 <= lat_f <= 90.0 and -180.0 <= lon_f <= 180.0):
             raise ValidationError("Coordinates out of range", "invalid_coordinates")
         location_name_normalized = location_name
 
@@ -453,8 +915,11 @@ def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
     if not isinstance(category, str) or category not in CATEGORIES:
         raise ValidationError("Invalid category", "incomplete_response")
 
+    # Locations are deduplicated while they are built, so the primary insert
+    # below only needs a set lookup.
     locations_payload = payload.get("locations")
     normalized_locations: list[dict[str, Any]] = []
+    seen_location_keys: set[tuple[str, float, float]] = set()
     if locations_payload is None:
         if location_name_normalized is not None and lat_f is not None and lon_f is not None:
             normalized_locations = [
@@ -464,6 +929,7 @@ def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
                     "longitude": lon_f,
                 }
             ]
+            seen_location_keys.add((location_name_normalized, lat_f, lon_f))
     else:
         if not isinstance(locations_payload, list):
             raise ValidationError("locations must be an array", "incomplete_response")
@@ -471,25 +937,27 @@ def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
         for entry in locations_payload:
             if not isinstance(entry, dict):
                 raise ValidationError("locations entries must be objects", "incomplete_response")
-
-            missing_location_fields = [field for field in LOCATION_ENTRY_FIELDS if field not in entry]
-            if missing_location_fields:
+            if not entry.keys() >= LOCATION_ENTRY_FIELD_SET:
                 raise ValidationError("locations entry missing fields", "incomplete_response")
 
-            entry_name = entry.get("location_name")
-            entry_lat = entry.get("latitude")
-            entry_lon = entry.get("longitude")
+            entry_name = entry["location_name"]
+            entry_lat = entry["latitude"]
+            entry_lon = entry["longitude"]
 
             if not isinstance(entry_name, str):
                 raise ValidationError("locations.location_name must be string", "incomplete_response")
-            if not isinstance(entry_lat, (int, float)) or not isinstance(entry_lon, (int, float)):
+            if type(entry_lat) not in NUMERIC_TYPES or type(entry_lon) not in NUMERIC_TYPES:
                 raise ValidationError("locations coordinates must be numeric", "incomplete_response")
 
             entry_lat_f = round(float(entry_lat), 4)
             entry_lon_f = round(float(entry_lon), 4)
-            if entry_lat_f < -90.0 or entry_lat_f > 90.0 or entry_lon_f < -180.0 or entry_lon_f > 180.0:
+            if not (-90.0 <= entry_lat_f <= 90.0 and -180.0 <= entry_lon_f <= 180.0):
                 raise ValidationError("locations coordinates out of range", "invalid_coordinates")
 
+            key = (entry_name, entry_lat_f, entry_lon_f)
+            if key in seen_location_keys:
+                continue
+            seen_location_keys.add(key)
             normalized_locations.append(
                 {
                     "location_name": entry_name,
@@ -505,16 +973,7 @@ def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
         lon_f = primary["longitude"]
 
     if location_name_normalized is not None and lat_f is not None and lon_f is not None:
-        primary_tuple = (location_name_normalized, lat_f, lon_f)
-        if not any(
-            (
-                entry["location_name"],
-                entry["latitude"],
-                entry["longitude"],
-            )
-            == primary_tuple
-            for entry in normalized_locations
-        ):
+        if (location_name_normalized, lat_f, lon_f) not in seen_location_keys:
             normalized_locations.insert(
                 0,
                 {
@@ -524,16 +983,7 @@ def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
                 },
             )
 
-    # Deduplicate while preserving order, then enforce max 3 locations.
-    deduped_locations: list[dict[str, Any]] = []
-    seen_location_keys: set[tuple[str, float, float]] = set()
-    for entry in normalized_locations:
-        key = (entry["location_name"], entry["latitude"], entry["longitude"])
-        if key in seen_location_keys:
-            continue
-        seen_location_keys.add(key)
-        deduped_locations.append(entry)
-    normalized_locations = deduped_locations[:3]
+    normalized_locations = normalized_locations[:3]
 
     normalized: dict[str, Any] = {
         "entity": payload.get("entity") if isinstance(payload.get("entity"), str) else None,
@@ -551,61 +1001,65 @@ def validate_payload(payload: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
-def is_locationless_market_question(question: str, category: str) -> bool:
+def validate_null_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Check only entity/reasoning/category and return a normalized no-location payload."""
+    category = payload.get("category")
+    if not isinstance(category, str) or category not in CATEGORIES:
+        raise ValidationError("Invalid category", "incomplete_response")
+
+    entity = payload.get("entity")
+    reasoning = payload.get("reasoning")
+    if not isinstance(entity, str) or not isinstance(reasoning, str):
+        raise ValidationError("Required string fields missing", "incomplete_response")
+
+    return {
+        "entity": entity,
+        "reasoning": reasoning,
+        "location_name": None,
+        "latitude": None,
+        "longitude": None,
+        "locations": [],
+        "category": category,
+    }
+
+
+def validate_model_payload(question: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Validate a fresh model answer, skipping location checks when it will be nulled anyway."""
+    category = payload.get("category")
+    expect_null = isinstance(category, str) and expects_null_location(question, category)
+    return validate_payload(payload, expect_null=expect_null)
+
+
+def is_locationless_market_question(lowered_question: str, category: str) -> bool:
     """Detect pure market-threshold questions that have no clear physical anchor."""
-    if category not in {"crypto", "finance"}:
+    if category not in LOCATIONLESS_MARKET_CATEGORIES:
         return False
 
-    lowered = question.lower()
-    patterns = [
-        r"\breach\s*\$?\d",
-        r"\bhit\s*\$?\d",
-        r"\bprice\b",
-        r"\btrading\s+above\b",
-        r"\btrading\s+below\b",
-        r"\babove\s*\$?\d",
-        r"\bbelow\s*\$?\d",
-    ]
-    return any(re.search(pattern, lowered) is not None for pattern in patterns)
+    return LOCATIONLESS_MARKET_RE.search(lowered_question) is not None
 
 
-def is_global_related_question(question: str, category: str) -> bool:
+def is_global_related_question(lowered_question: str, category: str) -> bool:
     """Detect globally scoped questions that should not map to one location."""
-    lowered = question.lower()
-
-    global_patterns = [
-        r"\bglobal\b",
-        r"\bworldwide\b",
-        r"\bworld\b",
-        r"\bany country\b",
-        r"\bany nation\b",
-        r"\banywhere\b",
-        r"\bin the world\b",
-        r"\bworld war\b",
-        r"\bnew pandemic\b",
-        r"\bglobal pandemic\b",
-        r"\bglobal recession\b",
-        r"\bplanet\b",
-    ]
-
-    if any(re.search(pattern, lowered) is not None for pattern in global_patterns):
+    if GLOBAL_QUESTION_RE.search(lowered_question) is not None:
         return True
 
-    if category in {"science", "natural_disaster"}:
-        broad_science_patterns = [
-            r"\brecord\b",
-            r"\bwarmest\b",
-            r"\bhottest\b",
-            r"\bearthquake\b",
-            r"\btsunami\b",
-            r"\bvolcanic\b",
-        ]
-        if any(re.search(pattern, lowered) is not None for pattern in broad_science_patterns):
+    if category in BROAD_SCIENCE_CATEGORIES:
+        if BROAD_SCIENCE_RE.search(lowered_question) is not None:
             return True
 
     return False
 
 
+@lru_cache(maxsize=8192)
+def expects_null_location(question: str, category: str) -> bool:
+    """Whether a result for this question/category always gets its location nulled."""
+    if category in ALWAYS_NULL_CATEGORIES:
+        return True
+    # Lowercased once here for both predicates; the result is memoized per pair.
+    lowered = question.lower()
+    return is_global_related_question(lowered, category) or is_locationless_market_question(lowered, category)
+
+
 def location_specificity_score(location_name: str | None) -> int:
     """Score how specific a location label appears."""
     if not isinstance(location_name, str) or not location_name.strip():
@@ -617,40 +1071,10 @@ def location_specificity_score(location_name: str | None) -> int:
     if "," in lowered:
         score += 1
 
-    specific_markers = [
-        "stadium",
-        "arena",
-        "center",
-        "centre",
-        "building",
-        "palace",
-        "capitol",
-        "parliament",
-        "house",
-        "hq",
-        "headquarters",
-        "office",
-        "ministry",
-        "court",
-        "exchange",
-        "bank",
-        "district",
-        "street",
-        "avenue",
-        "road",
-        "boulevard",
-        "tower",
-        "campus",
-        "base",
-        "strait",
-        "gulf",
-        "sea",
-    ]
-    if any(marker in lowered for marker in specific_markers):
+    if SPECIFIC_MARKER_RE.search(lowered) is not None:
         score += 2
 
-    words = [token for token in re.split(r"\s+", lowered) if token]
-    if len(words) >= 3:
+    if len(lowered.split()) >= 3:
         score += 1
 
     return score
@@ -665,45 +1089,14 @@ def should_refine_result(question: str, result: dict[str, Any]) -> bool:
     if not isinstance(category, str):
         return False
 
-    if category == "crypto" or is_global_related_question(question, category):
+    # Refining is wasted on answers apply_locationless_override will null out.
+    if expects_null_location(question, category):
         return False
 
     lowered_q = question.lower()
-    multi_location_signals = [
-        " vs ",
-        " x ",
-        " versus ",
-        " between ",
-        " and ",
-        " bilateral",
-        " coalition",
-        " alliance",
-        " trade deal",
-        " ceasefire",
-        " summit",
-        " finals",
-        " matchup",
-    ]
-    likely_multi_location = any(signal in lowered_q for signal in multi_location_signals)
-
-    military_or_policy = any(
-        keyword in lowered_q
-        for keyword in [
-            "military",
-            "clash",
-            "strike",
-            "war",
-            "invasion",
-            "attack",
-            "policy",
-            "bill",
-            "law",
-            "regulation",
-            "sanction",
-            "congress",
-            "parliament",
-        ]
-    )
+
+    likely_multi_location = MULTI_LOCATION_SIGNAL_RE.search(lowered_q) is not None
+    military_or_policy = MILITARY_OR_POLICY_RE.search(lowered_q) is not None
     sports = category == "sports"
     finance = category == "finance"
 
@@ -732,20 +1125,27 @@ async def refine_result(
     model: str,
     question: str,
     current_result: dict[str, Any],
+    max_retries: int,
     verbose: bool,
 ) -> dict[str, Any]:
-    """Try one refinement pass to improve location specificity."""
+    """Try one refinement pass to improve location specificity.
+
+    Rate-limit and connection failures are retried up to max_retries (--retry) attempts.
+    """
     try:
-        response = await client.chat.completions.create(
+        response = await create_completion_with_backoff(
+            client,
+            max_retries,
             model=model,
             temperature=0,
             max_tokens=260,
             response_format={"type": "json_object"},
+            user=REFINEMENT_PROMPT_USER_TAG,
             messages=[
-                {"role": "system", "content": REFINEMENT_PROMPT},
+                REFINEMENT_SYSTEM_MESSAGE,
                 {
                     "role": "user",
-                    "content": json.dumps(
+                    "content": dumps_json(
                         {
                             "question": question,
                             "previous_result": {
@@ -758,8 +1158,7 @@ async def refine_result(
                                 "category": current_result.get("category"),
                             },
                         },
-                        ensure_ascii=False,
-                    ),
+                    ).decode("utf-8"),
                 },
             ],
         )
@@ -800,48 +1199,28 @@ def apply_locationless_override(question: str, result: dict[str, Any]) -> dict[s
     if not isinstance(category, str):
         return result
 
-    if category == "crypto":
-        updated = dict(result)
-        updated["location_name"] = None
-        updated["latitude"] = None
-        updated["longitude"] = None
-        updated["locations"] = []
-        return updated
-
-    if is_global_related_question(question, category):
-        updated = dict(result)
-        updated["location_name"] = None
-        updated["latitude"] = None
-        updated["longitude"] = None
-        updated["locations"] = []
-        return updated
-
-    if not is_locationless_market_question(question, category):
+    # Already location-free (e.g. a cached crypto row): nothing to override.
+    if (
+        result.get("location_name") is None
+        and result.get("latitude") is None
+        and result.get("longitude") is None
+        and result.get("locations") == []
+    ):
+        return result
+
+    if not expects_null_location(question, category):
         return result
 
-    updated = dict(result)
-    updated["location_name"] = None
-    updated["latitude"] = None
-    updated["longitude"] = None
-    updated["locations"] = []
-    return updated
+    return {**result, **NULL_LOCATION_FIELDS, "locations": []}
 
 
 def build_error_result(question: str, error: str, source: str = "llm") -> dict[str, Any]:
     """Build standardized failed result row."""
-    return {
-        "question": question,
-        "entity": None,
-        "reasoning": None,
-        "location_name": None,
-        "latitude": None,
-        "longitude": None,
-        "locations": None,
-        "category": None,
-        "link": None,
-        "source": source,
-        "error": error,
-    }
+    result = ERROR_RESULT_TEMPLATE.copy()
+    result["question"] = question
+    result["source"] = source
+    result["error"] = error
+    return result
 
 
 def to_output_result(question: str, payload: dict[str, Any], source: str) -> dict[str, Any]:
@@ -896,40 +1275,74 @@ def extract_message_content(content: Any) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
-        parts: list[str] = []
-        for item in content:
-            if isinstance(item, dict):
-                text = item.get("text")
-                if isinstance(text, str):
-                    parts.append(text)
-            else:
-                text_attr = getattr(item, "text", None)
-                if isinstance(text_attr, str):
-                    parts.append(text_attr)
-        return "".join(parts)
+        texts = (
+            item.get("text") if isinstance(item, dict) else getattr(item, "text", None)
+            for item in content
+        )
+        return "".join(text for text in texts if isinstance(text, str))
     return ""
 
 
+def parse_retry_after(headers: Any) -> float | None:
+    """Seconds from a Retry-After header given in seconds, or None if absent/unparseable."""
+    if headers is None:
+        return None
+    value = headers.get("retry-after")
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 def compute_rate_limit_delay(attempt: int, exc: Exception | None = None) -> float:
     """Compute backoff delay with optional Retry-After header and jitter."""
     base = min(2 ** (attempt - 1), 30)
-    retry_after = None
-
     response = getattr(exc, "response", None)
-    headers = getattr(response, "headers", None)
-    if headers is not None:
-        retry_after_value = headers.get("retry-after")
-        if isinstance(retry_after_value, str):
-            try:
-                retry_after = float(retry_after_value)
-            except ValueError:
-                retry_after = None
+    retry_after = parse_retry_after(getattr(response, "headers", None))
 
-    delay = max(base, retry_after) if isinstance(retry_after, (int, float)) else base
+    delay = max(base, retry_after) if retry_after is not None else base
     jitter = random.uniform(0.0, 0.4)
     return delay + jitter
 
 
+async def create_completion_with_backoff(
+    client: AsyncOpenAI,
+    max_attempts: int,
+    **kwargs: Any,
+) -> Any:
+    """Call chat.completions.create, backing off on rate limits and connection errors.
+
+    The SDK's own retries are disabled for these calls, so max_attempts is the
+    total number of HTTP attempts. Other errors, and the last transient one,
+    propagate to the caller.
+    """
+    completions = client.with_options(max_retries=0).chat.completions
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await completions.create(**kwargs)
+        except (RateLimitError, APIConnectionError, APITimeoutError) as exc:
+            if attempt == max_attempts:
+                raise
+            await asyncio.sleep(compute_rate_limit_delay(attempt, exc))
+    raise ValueError("max_attempts must be at least 1")
+
+
+async def finalize_result(
+    client: AsyncOpenAI,
+    model: str,
+    question: str,
+    result: dict[str, Any],
+    max_retries: int,
+    verbose: bool,
+) -> dict[str, Any]:
+    """Refine a too-generic first answer if needed, then apply null overrides."""
+    if should_refine_result(question, result):
+        result = await refine_result(client, model, question, result, max_retries, verbose)
+    return apply_locationless_override(question, result)
+
+
 async def geocode_question(
     client: AsyncOpenAI,
     model: str,
@@ -947,8 +1360,9 @@ async def geocode_question(
                 temperature=0,
                 max_tokens=260,
                 response_format={"type": "json_object"},
+                user=SYSTEM_PROMPT_USER_TAG,
                 messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
+                    SYSTEM_MESSAGE,
                     {"role": "user", "content": question},
                 ],
             )
@@ -956,16 +1370,14 @@ async def geocode_question(
             message = response.choices[0].message
             content = extract_message_content(message.content)
             parsed = parse_model_json(content)
-            normalized = validate_payload(parsed)
+            normalized = validate_model_payload(question, parsed)
             result = to_output_result(question, normalized, source="llm")
-            if should_refine_result(question, result):
-                result = await refine_result(client, model, question, result, verbose)
-            return apply_locationless_override(question, result)
+            return await finalize_result(client, model, question, result, max_retries, verbose)
 
-        except RateLimitError:
+        except RateLimitError as exc:
             last_error = "rate limit"
             if attempt < max_retries:
-                await asyncio.sleep(compute_rate_limit_delay(attempt))
+                await asyncio.sleep(compute_rate_limit_delay(attempt, exc))
             continue
         except APIStatusError as exc:
             if exc.status_code == 429:
@@ -1013,24 +1425,106 @@ async def geocode_question(
     return build_error_result(question, last_error, source="llm")
 
 
-async def geocode_question_guarded(
-    semaphore: asyncio.Semaphore,
+def batch_custom_id(question: str) -> str:
+    """Stable Batch API request id for a question."""
+    return hashlib.sha1(question.encode("utf-8")).hexdigest()
+
+
+def build_batch_request(model: str, question: str) -> dict[str, Any]:
+    """Build one Batch API JSONL request mirroring geocode_question's call."""
+    return {
+        "custom_id": batch_custom_id(question),
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": model,
+            "temperature": 0,
+            "max_tokens": 260,
+            "response_format": {"type": "json_object"},
+            "user": SYSTEM_PROMPT_USER_TAG,
+            "messages": [
+                SYSTEM_MESSAGE,
+                {"role": "user", "content": question},
+            ],
+        },
+    }
+
+
+def parse_batch_output_line(line: str, questions_by_id: dict[str, str]) -> tuple[str, dict[str, Any]] | None:
+    """Parse one Batch API output row into question + unrefined result, or None if unusable."""
+    # A malformed row must only drop that question (it is retried live), never
+    # abort collecting the rest of a batch that may have taken hours.
+    try:
+        row = loads_json(line)
+        question = questions_by_id.get(row.get("custom_id"))
+        if question is None or row.get("error"):
+            return None
+
+        response = row.get("response") or {}
+        if response.get("status_code") != 200:
+            return None
+
+        message = response["body"]["choices"][0]["message"]
+        content = extract_message_content(message.get("content"))
+        normalized = validate_model_payload(question, parse_model_json(content))
+    except (KeyError, IndexError, TypeError, AttributeError, json.JSONDecodeError, ValidationError):
+        return None
+    return question, to_output_result(question, normalized, source="llm")
+
+
+async def geocode_with_batch_api(
     client: AsyncOpenAI,
     model: str,
-    question: str,
-    max_retries: int,
+    questions: list[str],
     verbose: bool,
-) -> tuple[str, dict[str, Any]]:
-    """Run geocoding under semaphore and return question + result."""
-    async with semaphore:
-        result = await geocode_question(
-            client=client,
-            model=model,
-            question=question,
-            max_retries=max_retries,
-            verbose=verbose,
-        )
-        return question, result
+) -> dict[str, dict[str, Any]]:
+    """Geocode questions through one Batch API job; return unrefined results that succeeded.
+
+    Questions missing from the returned mapping (failed rows, expired job) are
+    left for the caller to retry with live requests.
+    """
+    questions_by_id = {batch_custom_id(question): question for question in questions}
+    request_lines = b"".join(dumps_json(build_batch_request(model, question)) + b"\n" for question in questions)
+
+    input_file = await client.files.create(
+        file=("geolocate_batch.jsonl", request_lines),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted batch {batch.id} with {len(questions)} questions; polling for completion.", file=sys.stderr)
+
+    delay = BATCH_POLL_INITIAL_SECONDS
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+        batch = await client.batches.retrieve(batch.id)
+        if verbose:
+            counts = batch.request_counts
+            done = f" ({counts.completed}/{counts.total} done)" if counts is not None else ""
+            print(f"Batch {batch.id}: {batch.status}{done}", file=sys.stderr)
+
+    if batch.status != "completed":
+        print(f"Warning: batch {batch.id} ended with status {batch.status}.", file=sys.stderr)
+
+    results: dict[str, dict[str, Any]] = {}
+    if batch.output_file_id:
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            parsed = parse_batch_output_line(line, questions_by_id)
+            if parsed is None:
+                continue
+            question, result = parsed
+            results[question] = result
+
+    if verbose and len(results) < len(questions):
+        print(f"Batch {batch.id}: {len(questions) - len(results)} questions need live retries.", file=sys.stderr)
+    return results
 
 
 def print_progress(processed: int, total: int, cache_hits: int) -> None:
@@ -1063,8 +1557,8 @@ async def run_single(args: argparse.Namespace, client: AsyncOpenAI) -> int:
     )
 
     if args.cache is not None and "error" not in result:
-        cache[question] = to_cache_payload(result)
-        save_cache(args.cache, cache)
+        record_cache_entry(args.cache, cache, question, to_cache_payload(result))
+        compact_cache_if_needed(args.cache, cache)
 
     write_output(result, args.output_path)
     return 0
@@ -1111,8 +1605,7 @@ async def run_interactive(args: argparse.Namespace, client: AsyncOpenAI) -> int:
         write_output(result, None)
 
         if args.cache is not None and "error" not in result:
-            cache[question] = to_cache_payload(result)
-            save_cache(args.cache, cache)
+            record_cache_entry(args.cache, cache, question, to_cache_payload(result))
 
     if args.cache is not None:
         save_cache(args.cache, cache)
@@ -1131,6 +1624,11 @@ async def run_batch(args: argparse.Namespace, client: AsyncOpenAI) -> int:
 
     unique_questions = list(dict.fromkeys(questions))
     total_unique = len(unique_questions)
+    if args.verbose and total_unique < len(questions):
+        print(
+            f"Deduplicated {len(questions) - total_unique} repeated questions; each is geocoded once.",
+            file=sys.stderr,
+        )
 
     cache = load_cache(args.cache, verbose=args.verbose)
     results_by_question: dict[str, dict[str, Any]] = {}
@@ -1140,11 +1638,77 @@ async def run_batch(args: argparse.Namespace, client: AsyncOpenAI) -> int:
     api_calls = 0
     errors = 0
     new_cache_entries = 0
+    last_progress_print = float("-inf")
+
+    def report_progress() -> None:
+        nonlocal last_progress_print
+        now = time.monotonic()
+        if processed == total_unique or now - last_progress_print >= PROGRESS_PRINT_INTERVAL_SECONDS:
+            print_progress(processed, total_unique, cache_hits)
+            last_progress_print = now
+
+    # --concurrency workers drain a queue of API jobs: (question, None) geocodes
+    # live, (question, result) finalizes a Batch API answer; None stops a worker.
+    # New JSON-cache entries go to the append-only entry log (replayed by
+    # load_cache after a crash) and are folded into the snapshot once at the end.
+    jobs: asyncio.Queue[tuple[str, dict[str, Any] | None] | None] = asyncio.Queue()
+    cache_log: BinaryIO | None = None
+
+    def record_api_result(question: str, result: dict[str, Any]) -> None:
+        nonlocal processed, api_calls, errors, new_cache_entries, cache_log
+        results_by_question[question] = result
+        processed += 1
+        api_calls += 1
+        if "error" in result:
+            errors += 1
+        elif args.cache is not None:
+            payload = to_cache_payload(result)
+            cache[question] = payload
+            new_cache_entries += 1
+            if not isinstance(cache, SqliteCache):
+                if cache_log is None:
+                    cache_log = open_cache_log(args.cache)
+                append_cache_log(cache_log, question, payload)
+                if new_cache_entries % CACHE_LOG_SYNC_EVERY == 0:
+                    os.fsync(cache_log.fileno())
+        report_progress()
+
+    async def worker() -> None:
+        while (job := await jobs.get()) is not None:
+            question, batch_result = job
+            if batch_result is None:
+                result = await geocode_question(
+                    client=client,
+                    model=args.model,
+                    question=question,
+                    max_retries=args.retry,
+                    verbose=args.verbose,
+                )
+            else:
+                result = await finalize_result(
+                    client, args.model, question, batch_result, args.retry, args.verbose
+                )
+            record_api_result(question, result)
 
-    misses: list[str] = []
-    for question in unique_questions:
-        cached = cache.get(question)
-        if args.cache is not None and isinstance(cached, dict):
+    workers = [asyncio.create_task(worker()) for _ in range(args.concurrency)]
+    try:
+        # Questions without a cache row are certain misses: in live mode they are
+        # queued before the cached rows are validated, and validation yields to
+        # the loop periodically so the two overlap.
+        misses: list[str] = []
+        cached_rows: list[tuple[str, dict[str, Any]]] = []
+        for question in unique_questions:
+            cached = cache.get(question) if args.cache is not None else None
+            if isinstance(cached, dict):
+                cached_rows.append((question, cached))
+                continue
+            misses.append(question)
+            if not args.batch_api:
+                jobs.put_nowait((question, None))
+
+        for index, (question, cached) in enumerate(cached_rows, start=1):
+            if index % CACHE_VALIDATION_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
             result = normalize_cached_result(question, cached)
             if result is not None:
                 results_by_question[question] = apply_locationless_override(question, result)
@@ -1152,44 +1716,40 @@ async def run_batch(args: argparse.Namespace, client: AsyncOpenAI) -> int:
                 cache_hits += 1
                 if "error" in result:
                     errors += 1
-                print_progress(processed, total_unique, cache_hits)
+                report_progress()
                 continue
             if args.verbose:
                 print(f"Warning: invalid cache entry for question: {question}", file=sys.stderr)
             cache.pop(question, None)
-        else:
-            pass
-        misses.append(question)
-
-    semaphore = asyncio.Semaphore(args.concurrency)
-    tasks = [
-        asyncio.create_task(
-            geocode_question_guarded(
-                semaphore=semaphore,
-                client=client,
-                model=args.model,
-                question=question,
-                max_retries=args.retry,
-                verbose=args.verbose,
-            )
-        )
-        for question in misses
-    ]
+            misses.append(question)
+            if not args.batch_api:
+                jobs.put_nowait((question, None))
 
-    for task in asyncio.as_completed(tasks):
-        question, result = await task
-        results_by_question[question] = result
-        processed += 1
-        api_calls += 1
-        if "error" in result:
-            errors += 1
-        else:
-            if args.cache is not None:
-                cache[question] = to_cache_payload(result)
-                new_cache_entries += 1
-                if new_cache_entries % 50 == 0:
-                    save_cache(args.cache, cache)
-        print_progress(processed, total_unique, cache_hits)
+        if args.batch_api and misses:
+            try:
+                batch_results = await geocode_with_batch_api(
+                    client=client,
+                    model=args.model,
+                    questions=misses,
+                    verbose=args.verbose,
+                )
+            except (APIError, httpx2.HTTPError) as exc:
+                # Submitting, polling or downloading the job failed as a whole:
+                # keep the validated cache hits and geocode every miss live.
+                print(f"Warning: Batch API failed ({exc}); using live requests instead.", file=sys.stderr)
+                batch_results = {}
+            # Batch API answers still need refinement/overrides; anything it missed goes live.
+            for question in misses:
+                jobs.put_nowait((question, batch_results.get(question)))
+
+        for _ in workers:
+            jobs.put_nowait(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        if cache_log is not None:
+            cache_log.close()
 
     if args.cache is not None and new_cache_entries > 0:
         save_cache(args.cache, cache)
@@ -1210,30 +1770,72 @@ async def run_batch(args: argparse.Namespace, client: AsyncOpenAI) -> int:
     return 0
 
 
+def iter_json_chunks(payload: Any) -> Iterator[bytes]:
+    """Yield the 2-space-indented JSON encoding of payload in pieces.
+
+    A non-empty list is encoded one row at a time, re-indented one level (JSON
+    strings never contain raw newlines), so output matches dumps_json(indent=True)
+    without holding the whole document in memory.
+    """
+    if not isinstance(payload, list) or not payload:
+        yield dumps_json(payload, indent=True)
+        return
+
+    separator = b"[\n  "
+    for row in payload:
+        yield separator
+        yield dumps_json(row, indent=True).replace(b"\n", b"\n  ")
+        separator = b",\n  "
+    yield b"\n]"
+
+
 def write_output(payload: Any, output_path: str | None) -> None:
-    """Write JSON payload to stdout or file."""
-    serialized = json.dumps(payload, ensure_ascii=False, indent=2)
+    """Write JSON payload to stdout or file, streaming list rows."""
+    chunks = iter_json_chunks(payload)
     if output_path is None:
-        print(serialized)
+        for chunk in chunks:
+            sys.stdout.write(chunk.decode("utf-8"))
+        sys.stdout.write("\n")
         return
 
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write(serialized)
+    with path.open("wb") as handle:
+        handle.writelines(chunks)
 
 
 async def async_main(argv: list[str]) -> int:
     """Async CLI entrypoint."""
     args = parse_args(argv)
     api_key = ensure_api_key()
-    client = AsyncOpenAI(api_key=api_key)
+    # One shared connection pool sized to --concurrency, so every in-flight
+    # request can keep its connection alive instead of reconnecting.
+    rate_limit_gate = RateLimitGate()
+    event_hooks: dict[str, list[Any]] = {
+        "request": [rate_limit_gate.on_request],
+        "response": [rate_limit_gate.on_response],
+    }
+    if args.rpm:
+        event_hooks["request"].append(RequestThrottle(args.rpm).on_request)
+    http_client = DefaultAsyncHttpxClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=OPENAI_HTTP_TIMEOUT,
+        limits=httpx2.Limits(
+            max_connections=args.concurrency,
+            max_keepalive_connections=args.concurrency,
+        ),
+        event_hooks=event_hooks,
+    )
+    client = AsyncOpenAI(api_key=api_key, http_client=http_client)
 
-    if args.file_path:
-        return await run_batch(args, client)
-    if args.interactive:
-        return await run_interactive(args, client)
-    return await run_single(args, client)
+    try:
+        if args.file_path:
+            return await run_batch(args, client)
+        if args.interactive:
+            return await run_interactive(args, client)
+        return await run_single(args, client)
+    finally:
+        await client.close()
 
 
 def main() -> None:
@@ -6,37 +6,86 @@ import re
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module is used without it
+    orjson = None  # type: ignore[assignment]
+
+
+def load_json(path: str):
+    """Read and decode a JSON file, with orjson when installed."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(payload) -> bytes:
+    """Encode payload as 2-space-indented UTF-8 JSON, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def write_json(payload, path: str):
+    """Write payload as 2-space-indented UTF-8 JSON.
+    
+    A non-empty list is written one row at a time (re-indented one level), so
+    only one row's encoding is in memory; the bytes match a whole-list dump.
+    """
+    with open(path, 'wb') as f:
+        if not isinstance(payload, list) or not payload:
+            f.write(dumps_indented(payload))
+            return
+        separator = b'[\n  '
+        for row in payload:
+            f.write(separator)
+            f.write(dumps_indented(row).replace(b'\n', b'\n  '))
+            separator = b',\n  '
+        f.write(b'\n]')
+
+
+PUNCTUATION_RE = re.compile(r'[^\w\s?-]')
+# str.translate table deleting exactly the ASCII characters PUNCTUATION_RE removes
+ASCII_PUNCTUATION_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if PUNCTUATION_RE.match(c)
+))
+
 
 def normalize_question(question: str) -> str:
     """Normalize question text for better matching."""
     # Lowercase
     normalized = question.lower().strip()
-    # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized)
-    # Remove punctuation except question marks
-    normalized = re.sub(r'[^\w\s?-]', '', normalized)
-    return normalized
+    # Remove extra whitespace (split() uses the same whitespace set as \s)
+    normalized = ' '.join(normalized.split())
+    # Remove punctuation except question marks; the regex is only needed
+    # for non-ASCII text (curly quotes, accented letters)
+    if normalized.isascii():
+        return normalized.translate(ASCII_PUNCTUATION_TABLE)
+    return PUNCTUATION_RE.sub('', normalized)
+
+
+def build_normalized_url_map(url_map: dict) -> dict:
+    """Map normalized question -> URL (a later question wins on a collision)."""
+    normalize = normalize_question
+    return {normalize(question): url for question, url in url_map.items()}
+
 
+def load_url_maps(url_map_path: str):
+    """Load the question->URL map and build its normalized lookup."""
+    print(f"Loading URL map from {url_map_path}...", file=sys.stderr)
+    url_map = load_json(url_map_path)
+    
+    print("Building normalized question lookup...", file=sys.stderr)
+    return url_map, build_normalized_url_map(url_map)
 
-def merge_links_into_results(results_path: str, url_map_path: str, output_path: str):
+
+def merge_links_into_results(results_path: str, url_map: dict, normalized_url_map: dict, output_path: str):
     """Merge URL links into geocoded results JSON."""
     
     # Load geocoded results
     print(f"Loading geocoded results from {results_path}...", file=sys.stderr)
-    with open(results_path, 'r', encoding='utf-8') as f:
-        results = json.load(f)
-    
-    # Load URL map
-    print(f"Loading URL map from {url_map_path}...", file=sys.stderr)
-    with open(url_map_path, 'r', encoding='utf-8') as f:
-        url_map = json.load(f)
-    
-    # Build normalized lookup
-    print("Building normalized question lookup...", file=sys.stderr)
-    normalized_url_map = {}
-    for question, url in url_map.items():
-        norm_q = normalize_question(question)
-        normalized_url_map[norm_q] = url
+    results = load_json(results_path)
     
     # Merge
     print(f"Merging links into {len(results)} results...", file=sys.stderr)
@@ -44,18 +93,22 @@ def merge_links_into_results(results_path: str, url_map_path: str, output_path:
     normalized_matches = 0
     no_matches = 0
     
+    # Local aliases: these run once per row
+    url_map_get = url_map.get
+    normalized_get = normalized_url_map.get
     for item in results:
         question = item.get('question', '')
         
-        # Try exact match first
-        if question in url_map:
-            item['link'] = url_map[question]
+        # Try exact match first; only normalize on a miss
+        url = url_map_get(question)
+        if url is not None:
+            item['link'] = url
             exact_matches += 1
         else:
             # Try normalized match
-            norm_q = normalize_question(question)
-            if norm_q in normalized_url_map:
-                item['link'] = normalized_url_map[norm_q]
+            url = normalized_get(normalize_question(question))
+            if url is not None:
+                item['link'] = url
                 normalized_matches += 1
             else:
                 item['link'] = None
@@ -63,8 +116,7 @@ def merge_links_into_results(results_path: str, url_map_path: str, output_path:
     
     # Save
     print(f"Writing merged results to {output_path}...", file=sys.stderr)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    write_json(results, output_path)
     
     print(f"\nMerge complete!", file=sys.stderr)
     print(f"  Exact matches: {exact_matches}", file=sys.stderr)
@@ -73,25 +125,12 @@ def merge_links_into_results(results_path: str, url_map_path: str, output_path:
     print(f"  Total: {len(results)}", file=sys.stderr)
 
 
-def merge_links_into_cache(cache_path: str, url_map_path: str):
+def merge_links_into_cache(cache_path: str, url_map: dict, normalized_url_map: dict):
     """Merge URL links into geocode cache."""
     
     # Load cache
     print(f"Loading cache from {cache_path}...", file=sys.stderr)
-    with open(cache_path, 'r', encoding='utf-8') as f:
-        cache = json.load(f)
-    
-    # Load URL map
-    print(f"Loading URL map from {url_map_path}...", file=sys.stderr)
-    with open(url_map_path, 'r', encoding='utf-8') as f:
-        url_map = json.load(f)
-    
-    # Build normalized lookup
-    print("Building normalized question lookup...", file=sys.stderr)
-    normalized_url_map = {}
-    for question, url in url_map.items():
-        norm_q = normalize_question(question)
-        normalized_url_map[norm_q] = url
+    cache = load_json(cache_path)
     
     # Merge
     print(f"Merging links into {len(cache)} cache entries...", file=sys.stderr)
@@ -99,16 +138,20 @@ def merge_links_into_cache(cache_path: str, url_map_path: str):
     normalized_matches = 0
     no_matches = 0
     
+    # Local aliases: these run once per entry
+    url_map_get = url_map.get
+    normalized_get = normalized_url_map.get
     for question, data in cache.items():
-        # Try exact match first
-        if question in url_map:
-            data['link'] = url_map[question]
+        # Try exact match first; only normalize on a miss
+        url = url_map_get(question)
+        if url is not None:
+            data['link'] = url
             exact_matches += 1
         else:
             # Try normalized match
-            norm_q = normalize_question(question)
-            if norm_q in normalized_url_map:
-                data['link'] = normalized_url_map[norm_q]
+            url = normalized_get(normalize_question(question))
+            if url is not None:
+                data['link'] = url
                 normalized_matches += 1
             else:
                 data['link'] = None
@@ -116,8 +159,7 @@ def merge_links_into_cache(cache_path: str, url_map_path: str):
     
     # Save
     print(f"Writing merged cache to {cache_path}...", file=sys.stderr)
-    with open(cache_path, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+    write_json(cache, cache_path)
     
     print(f"\nCache merge complete!", file=sys.stderr)
     print(f"  Exact matches: {exact_matches}", file=sys.stderr)
@@ -142,21 +184,19 @@ def main():
     results_path = base_dir / "polymarket_all_results.json"
     cache_path = base_dir / ".geolocate_cache.json"
     
-    if command == "results":
-        output_path = base_dir / "polymarket_all_results_with_links.json"
-        merge_links_into_results(str(results_path), str(url_map_path), str(output_path))
+    if command not in ("results", "cache", "both"):
+        print(f"Unknown command: {command}", file=sys.stderr)
+        sys.exit(1)
     
-    elif command == "cache":
-        merge_links_into_cache(str(cache_path), str(url_map_path))
+    # Loaded and normalized once, even when both files are merged
+    url_map, normalized_url_map = load_url_maps(str(url_map_path))
     
-    elif command == "both":
+    if command in ("results", "both"):
         output_path = base_dir / "polymarket_all_results_with_links.json"
-        merge_links_into_results(str(results_path), str(url_map_path), str(output_path))
-        merge_links_into_cache(str(cache_path), str(url_map_path))
+        merge_links_into_results(str(results_path), url_map, normalized_url_map, str(output_path))
     
-    else:
-        print(f"Unknown command: {command}", file=sys.stderr)
-        sys.exit(1)
+    if command in ("cache", "both"):
+        merge_links_into_cache(str(cache_path), url_map, normalized_url_map)
 
 
 if __name__ == "__main__":